@@ -295,13 +295,18 @@ class BuildGenerator:
         remaining = self.attribute_points
         
         deps = getattr(self.hunter_class, 'attribute_dependencies', {})
+        # flatten the dependency map once: only attributes with prerequisites, as (required_attr, level) tuples
+        requirements = {attr: tuple(reqs.items()) for attr, reqs in deps.items() if reqs}
         exclusions = getattr(self.hunter_class, 'attribute_exclusions', [])
+        point_gates = getattr(self.hunter_class, 'attribute_point_gates', {})
         
         max_iterations = 10000
         iteration = 0
         stuck_count = 0
         while remaining > 0 and iteration < max_iterations:
             iteration += 1
+            # running total instead of re-summing the allocation for every gated attribute (see _can_unlock_attribute)
+            spent = self.attribute_points - remaining
             valid_attrs = []
             for attr in attrs:
                 cost = costs[attr]
@@ -313,12 +318,12 @@ class BuildGenerator:
                     max_lvl = int(max_levels[attr])
                     if result[attr] >= max_lvl:
                         continue
-                if attr in deps:
-                    can_use = all(result.get(req_attr, 0) >= req_level 
-                                 for req_attr, req_level in deps[attr].items())
+                if attr in requirements:
+                    can_use = all(result.get(req_attr, 0) >= req_level
+                                  for req_attr, req_level in requirements[attr])
                     if not can_use:
                         continue
-                if not self._can_unlock_attribute(attr, result, costs):
+                if attr in point_gates and spent - result[attr] * cost < point_gates[attr]:
                     continue
                 excluded = False
                 for excl_pair in exclusions:
@@ -3855,7 +3860,7 @@ class HunterTab:
             _loop_start = time.perf_counter()
             _gen_time = 0
             _sim_time = 0
-            _deepcopy_time = 0
+            _config_time = 0
             _validation_time = 0
             _other_time = 0
             for i in range(builds_per_tier):
@@ -3926,12 +3931,10 @@ class HunterTab:
                 
                 _validation_time += time.perf_counter() - _val_start
                 
-                _dc_start = time.perf_counter()
-                # Add to batch
-                config = copy.deepcopy(base_config)
-                config["talents"] = talents
-                config["attributes"] = attrs
-                _deepcopy_time += time.perf_counter() - _dc_start
+                _cfg_start = time.perf_counter()
+                # Add to batch - only talents/attributes differ per build, the rest of base_config is shared read-only
+                config = {**base_config, "talents": talents, "attributes": attrs}
+                _config_time += time.perf_counter() - _cfg_start
                 
                 pending_configs.append(config)
                 pending_metadata.append((talents, attrs))
@@ -3992,9 +3995,9 @@ class HunterTab:
             print(f"[TIMING] Tier complete: tested={total_tested} in {_total_time:.2f}s")
             print(f"[TIMING]   Generation: {_gen_time:.2f}s ({total_tested/_gen_time if _gen_time > 0 else 0:.0f}/s)")
             print(f"[TIMING]   Validation: {_validation_time:.2f}s")
-            print(f"[TIMING]   Deepcopy:   {_deepcopy_time:.2f}s")
+            print(f"[TIMING]   Config:     {_config_time:.2f}s")
             print(f"[TIMING]   Simulation: {_sim_time:.2f}s ({total_tested/_sim_time if _sim_time > 0 else 0:.0f}/s)")
-            print(f"[TIMING]   Other:      {_total_time - _gen_time - _validation_time - _deepcopy_time - _sim_time:.2f}s")
+            print(f"[TIMING]   Other:      {_total_time - _gen_time - _validation_time - _config_time - _sim_time:.2f}s")
             print(f"[TIMING]   OVERALL:    {total_tested/_total_time:.1f}/s")
             
             # Analyze tier results
@@ -4092,10 +4095,7 @@ class HunterTab:
             # Create configs for batch
             configs = []
             for talents, attrs in batch_builds:
-                config = copy.deepcopy(base_config)
-                config["talents"] = talents
-                config["attributes"] = attrs
-                configs.append(config)
+                configs.append({**base_config, "talents": talents, "attributes": attrs})
             
             try:
                 if use_rust and len(configs) > 1:
@@ -1,7 +1,9 @@
 import logging
-import random
 from collections import defaultdict
+from functools import lru_cache
 from heapq import heappush as hpush
+from itertools import islice
+from random import random as rand  # bound once, combat rolls skip the module attribute lookup
 from typing import Dict, List, Tuple
 
 import yaml
@@ -9,9 +11,26 @@ from util.exceptions import BuildConfigError
 
 hunter_name_spacing: int = 7
 
+# Simulation queue event tags. Queue entries are (time, priority, event) tuples, so the tag breaks ties between
+# events with equal time and priority: the values keep the order of the string tags they replace.
+EVENT_ENEMY, EVENT_ENEMY_SPECIAL, EVENT_HUNTER, EVENT_HUNTER_SPECIAL, EVENT_REGEN, EVENT_STUN = range(6)
+
+
+@lru_cache(maxsize=None)
+def gadget_mult(level: int) -> float:
+    """Stat multiplier granted by a single gadget. Gadget levels are few and shared across all hunters, so results are cached.
+
+    WASM-verified: ~0.3% per level + 0.2% bonus per 10 levels, i.e. `(1 + level * 0.003) * (1.002 ** (level // 10))`.
+
+    Args:
+        level (int): The gadget level.
+
+    Returns:
+        float: The multiplier for hp, power and regen.
+    """
+    return (1 + level * 0.003) * (1.002 ** (level // 10))
+
 # TODO: validate vectid elixir
-# TODO: Ozzy: move @property code to on_death() to speed things up?
-# TODO: Borge: move @property code as well?
 # TODO: DwD power is a little off: 200 ATK, 2 exo, 3 DwD, 1 revive should be 110.59 power but is 110.71. I think DwD might be 0.0196 power instead of 0.02
 
 """ Assumptions:
@@ -21,9 +40,26 @@ hunter_name_spacing: int = 7
 """
 
 class Hunter:
+    # fixed attribute layout: hunters are created for every simulation run, so skip the per-instance __dict__
+    __slots__ = (
+        'name', '_log_prefix', 'sim', 'catching_up', 'meta', 'max_stage',
+        'base_stats', 'talents', 'attributes', 'mods', 'inscryptions', 'relics', 'gems', 'gadgets', 'bonuses',
+        'hp', 'max_hp', 'regen', 'evade_chance', 'lifesteal',
+        'current_stage', 'is_boss_stage', 'total_kills', 'elapsed_time', 'times_revived', 'revive_log', 'enrage_log',
+        'total_attacks', 'total_damage',
+        'total_taken', 'total_regen', 'total_attacks_suffered', 'total_lifesteal', 'total_potion',
+        'total_evades', 'total_mitigated',
+        'total_effect_procs', 'total_lucky_loot_procs', 'total_stuntime_inflicted',
+        'total_loot', 'loot_common', 'loot_uncommon', 'loot_rare', 'total_xp',
+        '_call_me_lucky_loot', '_loot_mult', '_xp_mult',
+    )
+    # short relic ids accepted in build configs, folded into the canonical relic names by load_build()
+    relic_aliases = {"r7": "manifestation_core_titan", "r19": "book_of_mephisto"}
+
     ### SETUP
     def __init__(self, name: str) -> None:
         self.name = name
+        self._log_prefix: str = f'[{name:>{hunter_name_spacing}}]'  # padded once, reused by every debug line
         self.missing_hp: float
         self.missing_hp_pct: float
         self.sim = None
@@ -32,6 +68,7 @@ class Hunter:
         # statistics
         # main
         self.current_stage = 0
+        self.is_boss_stage: bool = False  # kept in sync with current_stage by complete_stage()
         self.total_kills: int = 0
         self.elapsed_time: int = 0
         self.times_revived: int = 0
@@ -63,6 +100,8 @@ class Hunter:
         self.loot_uncommon: float = 0  # Material 2 (Behlium/Galvarium/Quartz)
         self.loot_rare: float = 0      # Material 3 (Hellish-Biomatter/Vectid Crystals/Tesseracts)
         self.total_xp: float = 0       # XP earned
+        self._loot_mult: float = None  # materialized by calculate_final_loot()
+        self._xp_mult: float = None
 
     @classmethod
     def from_file(cls, file_path: str) -> 'Hunter':
@@ -169,7 +208,11 @@ class Hunter:
         self.mods = defaultdict(int, config_dict.get("mods", {}))
         self.inscryptions = defaultdict(int, {k: self.costs["inscryptions"][k]["max"] if v == "max" else v for k, v in config_dict.get("inscryptions", {}).items()})
         self.relics = defaultdict(int, config_dict.get("relics", {}))
+        for alias, relic in self.relic_aliases.items():
+            if alias in self.relics:
+                self.relics[relic] = max(self.relics[relic], self.relics.pop(alias))
         self.gems = defaultdict(int, config_dict.get("gems", {}))
+        self._call_me_lucky_loot = self.talents["call_me_lucky_loot"]
         # New fields with defaults
         self.gadgets = defaultdict(int, config_dict.get("gadgets", {"wrench": 0, "zaptron": 0, "anchor": 0}))
         self.bonuses = config_dict.get("bonuses", {
@@ -259,9 +302,9 @@ class Hunter:
         Args:
             damage (float): The amount of damage to receive.
         """
-        if random.random() < self.evade_chance:
+        if rand() < self.evade_chance:
             self.total_evades += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE')
+            logging.debug('%s[@%5s]:\tEVADE', self._log_prefix, self.sim.elapsed_time)
             return 0
         else:
             mitigated_damage = damage * (1 - self.damage_reduction)
@@ -269,7 +312,7 @@ class Hunter:
             self.total_taken += mitigated_damage
             self.total_mitigated += (damage - mitigated_damage)
             self.total_attacks_suffered += 1
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
+            logging.debug("%s[@%5s]:\tTAKE\t%6.2f, %.2f HP left", self._log_prefix, self.sim.elapsed_time, mitigated_damage, self.hp)
             if self.is_dead():
                 self.on_death()
             return mitigated_damage
@@ -279,13 +322,14 @@ class Hunter:
 
         Args:
             value (float): The amount of hp to heal.
-            source (str): The source of the healing. Valid: regen, lifesteal, life_of_the_hunt
+            source (str): The source of the healing. Valid: regen, steal, loth, potion (lowercase).
         """
-        effective_heal = min(value, self.missing_hp)
+        effective_heal = min(value, self.max_hp - self.hp)
         overhealing = value - effective_heal
         self.hp += effective_heal
-        logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t{source.upper().replace("_", " ")}\t{effective_heal:>6.2f} (+{overhealing:>6.2f} OVERHEAL)')
-        match source.lower():
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('%s[@%5s]:\t%s\t%6.2f (+%6.2f OVERHEAL)', self._log_prefix, self.sim.elapsed_time, source.upper().replace("_", " "), effective_heal, overhealing)
+        match source:
             case 'regen':
                 self.total_regen += effective_heal
             case 'steal':
@@ -317,9 +361,8 @@ class Hunter:
         
         # Call Me Lucky Loot proc (not on bosses) - independent RNG, separate from other effect procs
         # Each talent/ability has its own effect_chance roll, so Lucky Loot gets its own counter
-        if loot_type != 'boss' and (stage % 100 != 0 and stage > 0) and random.random() < self.effect_chance:
-            if self.talents["call_me_lucky_loot"] > 0:
-                self.total_lucky_loot_procs += 1
+        if self._call_me_lucky_loot > 0 and loot_type != 'boss' and (not self.is_boss_stage and stage > 0) and rand() < self.effect_chance:
+            self.total_lucky_loot_procs += 1
 
     def compute_loot_multiplier(self) -> float:
         """Compute the loot multiplier from talents, attributes, inscryptions, bonuses, etc.
@@ -347,7 +390,7 @@ class Hunter:
         
         # === RELIC #7 (Manifestation Core: Titan) ===
         # 1.05^level (max 100)
-        relic7 = self.relics.get("r7", 0) or self.relics.get("manifestation_core_titan", 0)
+        relic7 = self.relics["manifestation_core_titan"]
         if relic7 > 0:
             mult *= 1.05 ** relic7
         
@@ -527,7 +570,7 @@ class Hunter:
         
         # Borge: Relic r19 (Book of Mephisto) = 2^level XP bonus (max 8 levels)
         if isinstance(self, Borge):
-            r19 = self.relics.get("r19", 0) or self.relics.get("book_of_mephisto", 0)
+            r19 = self.relics["book_of_mephisto"]
             if r19 > 0:
                 xp_bonus *= 2 ** min(r19, 8)
             
@@ -565,6 +608,7 @@ class Hunter:
             stages (int, optional): The number of stages to complete. Defaults to 1.
         """
         self.current_stage += stages
+        self.is_boss_stage = self.current_stage % 100 == 0 and self.current_stage > 0
         if self.current_stage >= self.max_stage:
             self.hp = 0
             self.times_revived = self.talents.get("death_is_my_companion", 2)  # Prevent revive at max_stage
@@ -657,7 +701,7 @@ class Hunter:
         # Get loot multiplier from all sources (inscryptions, relics, gems, talents, etc.)
         # NOTE: compute_loot_multiplier() now includes gem_bonus (attraction_node_#3),
         # pog_bonus (presence_of_god), and ll_bonus (call_me_lucky_loot)
-        loot_mult = self.compute_loot_multiplier()
+        loot_mult = self._loot_mult = self.compute_loot_multiplier()
         
         # Final loot = BASE × GeomSum × EnemiesPerStage × LootMultiplier
         self.loot_common = BASE_COMMON * total_enemy_factor * loot_mult
@@ -667,7 +711,7 @@ class Hunter:
         
         # XP calculation: XP is per-stage accumulation, NOT geometric series
         # XP = BASE × stage × xp_mult
-        xp_mult = self.get_xp_bonus()
+        xp_mult = self._xp_mult = self.get_xp_bonus()
         self.total_xp = BASE_XP * stage * xp_mult
 
     def is_dead(self) -> bool:
@@ -686,9 +730,9 @@ class Hunter:
             self.hp = self.max_hp * 0.8
             self.revive_log.append(self.current_stage)
             self.times_revived += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tREVIVED, {self.talents["death_is_my_companion"] - self.times_revived} left')
+            logging.debug('%s[@%5s]:\tREVIVED, %s left', self._log_prefix, self.sim.elapsed_time, self.talents["death_is_my_companion"] - self.times_revived)
         else:
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDIED\n')
+            logging.debug('%s[@%5s]:\tDIED\n', self._log_prefix, self.sim.elapsed_time)
 
 
     ### UTILITY
@@ -702,13 +746,15 @@ class Hunter:
 
     @property
     def loot_mult(self) -> float:
-        """Get the loot multiplier (calls compute_loot_multiplier)."""
-        return self.compute_loot_multiplier()
+        """Get the loot multiplier. Uses the value materialized by calculate_final_loot(), or computes it if the run
+        hasn't finished yet."""
+        return self._loot_mult if self._loot_mult is not None else self.compute_loot_multiplier()
 
     @property
     def xp_mult(self) -> float:
-        """Get the XP multiplier (calls get_xp_bonus)."""
-        return self.get_xp_bonus()
+        """Get the XP multiplier. Uses the value materialized by calculate_final_loot(), or computes it if the run
+        hasn't finished yet."""
+        return self._xp_mult if self._xp_mult is not None else self.get_xp_bonus()
 
     def show_build(self, in_colour: bool = True) -> None:
         """Prints the build of this Hunter's instance.
@@ -756,10 +802,22 @@ class Hunter:
         Returns:
             str: The stats as a formatted string.
         """
-        return f'[{self.name:>{hunter_name_spacing}}]:\t[HP:{(str(round(self.hp, 2)) + "/" + str(round(self.max_hp, 2))):>18}] [AP:{self.power:>8.2f}] [Regen:{self.regen:>7.2f}] [DR: {self.damage_reduction:>6.2%}] [Evasion: {self.evade_chance:>6.2%}] [Effect: {self.effect_chance:>6.2%}] [SpC: {self.special_chance:>6.2%}] [SpD: {self.special_damage:>5.2f}] [Speed:{self.speed:>5.2f}] [LS: {self.lifesteal:>4.2%}]'
+        return f'{self._log_prefix}:\t[HP:{(str(round(self.hp, 2)) + "/" + str(round(self.max_hp, 2))):>18}] [AP:{self.power:>8.2f}] [Regen:{self.regen:>7.2f}] [DR: {self.damage_reduction:>6.2%}] [Evasion: {self.evade_chance:>6.2%}] [Effect: {self.effect_chance:>6.2%}] [SpC: {self.special_chance:>6.2%}] [SpD: {self.special_damage:>5.2f}] [Speed:{self.speed:>5.2f}] [LS: {self.lifesteal:>4.2%}]'
 
 
 class Borge(Hunter):
+    __slots__ = (
+        'minotaur_dr', 'special_damage', 'fires_of_war',
+        'damage_reduction', 'effect_chance', 'special_chance', '_stage_speed', '_catch_up_factor',
+        '_power', '_damage_reduction', '_effect_chance', '_special_chance', '_speed',
+        'total_crits', 'total_extra_from_crits', 'total_helltouch', 'helltouch_kills', 'trample_kills',
+        'total_loth', 'total_inhaler',
+        # build levels read on the combat path, see __create__
+        '_trample', '_life_of_the_hunt', '_impeccable_impacts', '_fires_of_war', '_unfair_advantage',
+        '_weakspot_analysis', '_helltouch_barrier', '_inhaler_coeff', '_born_for_battle', '_atlas_protocol',
+        '_catch_up_mult', '_stun_duration', '_pog_coeff', '_ood_coeff',
+    )
+
     ### SETUP
     # Attribute unlock dependencies with point gate requirements:
     # Chain 1: 1 -> 2 -> 3 -> 4 -> 12 (75 pts) -> 13 (180 pts)
@@ -968,18 +1026,12 @@ class Borge(Hunter):
         """
         self.load_build(config_dict)
         
-        # Calculate gadget multipliers (WASM-verified: ~0.3% per level + 0.2% bonus per 10 levels)
-        # WASM formula: (1 + level * 0.003) * (1.002 ** (level // 10))
-        def gadget_mult(level):
-            return (1 + level * 0.003) * (1.002 ** (level // 10))
-        
-        gadget_hp_mult = (
+        # Combined gadget multiplier, applies identically to hp, power and regen
+        gadget_stat_mult = (
             gadget_mult(self.gadgets.get("wrench_of_gore", 0)) *
             gadget_mult(self.gadgets.get("zaptron_533", 0)) *
             gadget_mult(self.gadgets.get("anchor_of_ages", 0))
         )
-        gadget_power_mult = gadget_hp_mult  # Same multiplier for power
-        gadget_regen_mult = gadget_hp_mult  # Same multiplier for regen
         
         # The Legacy of Ultima: +1% HP/Power/Regen per point (WASM: bc * 0.01 + 1.0)
         talent_dump_mult = 1 + (self.talents.get("legacy_of_ultima", 0) * 0.01)
@@ -997,7 +1049,7 @@ class Borge(Hunter):
             * (1 + (0.015 * (self.meta.get("level", 0) - 39)) * self.gems.get("creation_node_#3", 0))
             * (1 + (0.02 * self.gems.get("creation_node_#2", 0)))
             * (1 + (0.2 * self.gems.get("creation_node_#1", 0)))
-            * gadget_hp_mult
+            * gadget_stat_mult
             * talent_dump_mult
         )
         # Inscryptions add flat HP AFTER multipliers
@@ -1018,7 +1070,7 @@ class Borge(Hunter):
             * (1 + (0.02 * self.gems["creation_node_#2"]))
             * (1 + (0.03 * self.gems["innovation_node_#3"]))
             * (1 + (self.attributes["soul_of_the_minotaur"] * 0.01))  # WASM: +1% power per level
-            * gadget_power_mult
+            * gadget_stat_mult
             * talent_dump_mult
         )
         # Soul of Minotaur unique DR (separate multiplicative layer, like Scarab for Ozzy)
@@ -1033,11 +1085,11 @@ class Borge(Hunter):
             * (1 + (self.attributes["essence_of_ylith"] * 0.009))
             * (1 + (0.005 * (self.meta["level"] - 39)) * self.gems["creation_node_#3"])
             * (1 + (0.02 * self.gems["creation_node_#2"]))
-            * gadget_regen_mult
+            * gadget_stat_mult
             * talent_dump_mult
         )
         # damage_reduction
-        self.damage_reduction = (
+        self._damage_reduction = (
             (
                 0
                 + (self.base_stats["damage_reduction"] * 0.0144)
@@ -1054,7 +1106,7 @@ class Borge(Hunter):
             + (self.attributes["superior_sensors"] * 0.016)
         )
         # effect_chance
-        self.effect_chance = (
+        self._effect_chance = (
             (
                 0.04
                 + (self.base_stats["effect_chance"] * 0.005)
@@ -1065,7 +1117,7 @@ class Borge(Hunter):
             * (1 + (0.02 * self.gems["creation_node_#2"]))
         )
         # special_chance
-        self.special_chance = (
+        self._special_chance = (
             (
                 0.05
                 + (self.base_stats["special_chance"] * 0.0018)
@@ -1082,7 +1134,7 @@ class Borge(Hunter):
             + (self.attributes["explosive_punches"] * 0.08)
         )
         # speed
-        self.speed = (
+        self._speed = (
             5
             - (self.base_stats["speed"] * 0.03)
             - (self.inscryptions["i23"] * 0.04)
@@ -1090,101 +1142,135 @@ class Borge(Hunter):
         # lifesteal
         self.lifesteal = (self.attributes["book_of_baal"] * 0.0111)
         self.fires_of_war: float = 0
+        # unpack the build levels the combat path reads so attacks and getters skip the dict lookups
+        self._trample = self.mods["trample"]
+        self._life_of_the_hunt = self.talents["life_of_the_hunt"]
+        self._impeccable_impacts = self.talents["impeccable_impacts"]
+        self._fires_of_war = self.talents["fires_of_war"]
+        self._unfair_advantage = self.talents["unfair_advantage"]
+        self._weakspot_analysis = self.attributes["weakspot_analysis"]
+        self._helltouch_barrier = self.attributes["helltouch_barrier"]
+        self._inhaler_coeff = self.attributes["lifedrain_inhalers"] * 0.0008
+        self._born_for_battle = self.attributes["born_for_battle"]
+        self._atlas_protocol = self.attributes["atlas_protocol"]
+        self._catch_up_mult = (1.08 ** self.gems["attraction_catch-up"]) ** (1 + (self.gems["attraction_gem"] * 0.1) - 0.1)
+        # full-strength effect sizes, halved against bosses / on boss stages
+        self._stun_duration = self._impeccable_impacts * 0.1
+        self._pog_coeff = self.talents["presence_of_god"] * 0.04
+        self._ood_coeff = self.talents["omen_of_defeat"] * 0.08
+        self._refresh_stage_stats()
+
+    def _refresh_stage_stats(self) -> None:
+        """Materialize the stats that only change between stages: the Atlas Protocol bonuses on boss stages and the
+        Attraction gem catch-up bonus. Runs from __create__ and from complete_stage() when either condition flips.
+        """
+        boss = self.is_boss_stage
+        self.damage_reduction = (self._damage_reduction + self._atlas_protocol * 0.007) if boss else self._damage_reduction
+        self.effect_chance = (self._effect_chance + self._atlas_protocol * 0.014) if boss else self._effect_chance
+        self.special_chance = (self._special_chance + self._atlas_protocol * 0.025) if boss else self._special_chance
+        self._catch_up_factor = self._catch_up_mult if self.catching_up else 1
+        stage_speed = (self._speed * (1 - self._atlas_protocol * 0.04)) if boss else self._speed
+        stage_speed /= self._catch_up_factor
+        self._stage_speed = stage_speed
+
+    # empty build template; load_dummy() returns a per-section copy
+    _DUMMY_TEMPLATE = {
+        "meta": {
+            "hunter": "Borge",
+            "level": 0
+        },
+        "stats": {
+            "hp": 0,
+            "power": 0,
+            "regen": 0,
+            "damage_reduction": 0,
+            "evade_chance": 0,
+            "effect_chance": 0,
+            "special_chance": 0,
+            "special_damage": 0,
+            "speed": 0,
+        },
+        "talents": {
+            "death_is_my_companion": 0,
+            "life_of_the_hunt": 0,
+            "unfair_advantage": 0,
+            "impeccable_impacts": 0,
+            "omen_of_defeat": 0,
+            "call_me_lucky_loot": 0,
+            "presence_of_god": 0,
+            "fires_of_war": 0,
+            "legacy_of_ultima": 0,
+        },
+        "attributes": {
+            "soul_of_ares": 0,
+            "essence_of_ylith": 0,
+            "helltouch_barrier": 0,
+            "book_of_baal": 0,
+            "spartan_lineage": 0,
+            "explosive_punches": 0,
+            "lifedrain_inhalers": 0,
+            "superior_sensors": 0,
+            "born_for_battle": 0,
+            "timeless_mastery": 0,
+            "weakspot_analysis": 0,
+            "atlas_protocol": 0,
+            "soul_of_athena": 0,
+            "soul_of_hermes": 0,
+            "soul_of_the_minotaur": 0,
+        },
+        "inscryptions": {
+            "i3": 0,  # 6 borge hp
+            "i4": 0,  # 0.0065 borge crit
+            "i11": 0, # 0.02 borge effect chance
+            "i13": 0, # 8 borge power
+            "i14": 0, # 1.1 borge loot
+            "i23": 0, # 0.04 borge speed
+            "i24": 0, # 0.004 borge dr
+            "i27": 0, # 24 borge hp
+            "i44": 0, # 1.08 borge loot
+            "i60": 0, # 0.03 borge hp, power, loot
+        },
+        "mods": {
+            "trample": False,
+        },
+        "relics": {
+            "disk_of_dawn": 0,
+            "long_range_artillery_crawler": 0,
+            "manifestation_core_titan": 0,
+            "book_of_mephisto": 0,
+        },
+        "gems": {
+            "attraction_gem": 0,
+            "attraction_catch-up": 0,
+            "attraction_node_#3": 0,
+            "innovation_node_#3" : 0,
+            "creation_node_#1": 0,
+            "creation_node_#2": 0,
+            "creation_node_#3": 0,
+        },
+        "gadgets": {
+            "wrench_of_gore": 0,
+            "zaptron_533": 0,
+            "anchor_of_ages": 0,
+        },
+        "bonuses": {
+            "shard_milestone": 0,
+            "iap_travpack": False,
+            "diamond_loot": 0,
+            "diamond_revive": 0,
+            "ultima_multiplier": 1.0,
+        },
+    }
 
     @staticmethod
     def load_dummy() -> dict:
         """Create a dummy build dictionary with empty stats to compare against loaded configs.
+        Every section is a fresh copy of the class template, so callers are free to fill it in.
 
         Returns:
             dict: The dummy build dict.
         """
-        return {
-            "meta": {
-                "hunter": "Borge",
-                "level": 0
-            },
-            "stats": {
-                "hp": 0,
-                "power": 0,
-                "regen": 0,
-                "damage_reduction": 0,
-                "evade_chance": 0,
-                "effect_chance": 0,
-                "special_chance": 0,
-                "special_damage": 0,
-                "speed": 0,
-            },
-            "talents": {
-                "death_is_my_companion": 0,
-                "life_of_the_hunt": 0,
-                "unfair_advantage": 0,
-                "impeccable_impacts": 0,
-                "omen_of_defeat": 0,
-                "call_me_lucky_loot": 0,
-                "presence_of_god": 0,
-                "fires_of_war": 0,
-                "legacy_of_ultima": 0,
-            },
-            "attributes": {
-                "soul_of_ares": 0,
-                "essence_of_ylith": 0,
-                "helltouch_barrier": 0,
-                "book_of_baal": 0,
-                "spartan_lineage": 0,
-                "explosive_punches": 0,
-                "lifedrain_inhalers": 0,
-                "superior_sensors": 0,
-                "born_for_battle": 0,
-                "timeless_mastery": 0,
-                "weakspot_analysis": 0,
-                "atlas_protocol": 0,
-                "soul_of_athena": 0,
-                "soul_of_hermes": 0,
-                "soul_of_the_minotaur": 0,
-            },
-            "inscryptions": {
-                "i3": 0,  # 6 borge hp
-                "i4": 0,  # 0.0065 borge crit
-                "i11": 0, # 0.02 borge effect chance
-                "i13": 0, # 8 borge power
-                "i14": 0, # 1.1 borge loot
-                "i23": 0, # 0.04 borge speed
-                "i24": 0, # 0.004 borge dr
-                "i27": 0, # 24 borge hp
-                "i44": 0, # 1.08 borge loot
-                "i60": 0, # 0.03 borge hp, power, loot
-            },
-            "mods": {
-                "trample": False,
-            },
-            "relics": {
-                "disk_of_dawn": 0,
-                "long_range_artillery_crawler": 0,
-                "manifestation_core_titan": 0,
-                "book_of_mephisto": 0,
-            },
-            "gems": {
-                "attraction_gem": 0,
-                "attraction_catch-up": 0,
-                "attraction_node_#3": 0,
-                "innovation_node_#3" : 0,
-                "creation_node_#1": 0,
-                "creation_node_#2": 0,
-                "creation_node_#3": 0,
-            },
-            "gadgets": {
-                "wrench_of_gore": 0,
-                "zaptron_533": 0,
-                "anchor_of_ages": 0,
-            },
-            "bonuses": {
-                "shard_milestone": 0,
-                "iap_travpack": False,
-                "diamond_loot": 0,
-                "diamond_revive": 0,
-                "ultima_multiplier": 1.0,
-            },
-        }
+        return {section: dict(values) for section, values in Borge._DUMMY_TEMPLATE.items()}
 
     def attack(self, target) -> None:
         """Attack the enemy unit.
@@ -1192,19 +1278,19 @@ class Borge(Hunter):
         Args:
             target (_type_): The enemy to attack.
         """
-        if random.random() < self.special_chance:
+        if rand() < self.special_chance:
             damage = self.power * self.special_damage
             self.total_crits += 1
             self.total_extra_from_crits += (damage - self.power)
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} (crit)")
+            logging.debug("%s[@%5s]:\tATTACK\t%6.2f (crit)", self._log_prefix, self.sim.elapsed_time, damage)
         else:
             damage = self.power
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f}")
-        if self.mods["trample"] and not target.is_boss() and damage > target.max_hp:
+            logging.debug("%s[@%5s]:\tATTACK\t%6.2f", self._log_prefix, self.sim.elapsed_time, damage)
+        if self._trample and not target.is_boss() and damage > target.max_hp:
             # Mod: Trample
             trample_kills = self.apply_trample(damage, current_target=target)
             if trample_kills > 1:
-                logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTRAMPLE {trample_kills} enemies")
+                logging.debug("%s[@%5s]:\tTRAMPLE %s enemies", self._log_prefix, self.sim.elapsed_time, trample_kills)
                 self.trample_kills += trample_kills
             else:
                 super(Borge, self).attack(target, damage)
@@ -1215,17 +1301,17 @@ class Borge(Hunter):
 
         #  on_attack() effects
         self.heal_hp(damage * self.lifesteal, 'steal')
-        if random.random() < self.effect_chance and (LotH := self.talents["life_of_the_hunt"]):
+        if (LotH := self._life_of_the_hunt) and rand() < self.effect_chance:
             # Talent: Life of the Hunt
             LotH_healing = damage * LotH * 0.06
             self.heal_hp(LotH_healing, "loth")
             self.total_loth += LotH_healing
             self.total_effect_procs += 1
-        if random.random() < self.effect_chance and self.talents["impeccable_impacts"]:
+        if self._impeccable_impacts and rand() < self.effect_chance:
             # Talent: Impeccable Impacts, will call Hunter.apply_stun()
-            hpush(self.sim.queue, (0, 0, 'stun'))
+            hpush(self.sim.queue, (0, 0, EVENT_STUN))
             self.total_effect_procs += 1
-        if random.random() < self.effect_chance and self.talents["fires_of_war"]:
+        if self._fires_of_war and rand() < self.effect_chance:
             # Talent: Fires of War
             self.apply_fow()
             self.total_effect_procs += 1
@@ -1243,30 +1329,44 @@ class Borge(Hunter):
         damage_after_minotaur = damage * (1 - self.minotaur_dr)
         
         if is_crit:
-            reduced_crit_damage = damage_after_minotaur * (1 - self.attributes["weakspot_analysis"] * 0.11)
+            reduced_crit_damage = damage_after_minotaur * (1 - self._weakspot_analysis * 0.11)
             final_damage = super(Borge, self).receive_damage(reduced_crit_damage)
         else:
             final_damage = super(Borge, self).receive_damage(damage_after_minotaur)
         if (not self.is_dead()) and final_damage > 0:
-            helltouch_effect = (0.1 if (self.current_stage % 100 == 0 and self.current_stage > 0) else 1)
-            reflected_damage = final_damage * self.attributes["helltouch_barrier"] * 0.08 * helltouch_effect
+            helltouch_effect = (0.1 if self.is_boss_stage else 1)
+            reflected_damage = final_damage * self._helltouch_barrier * 0.08 * helltouch_effect
             self.total_helltouch += reflected_damage
             attacker.receive_damage(reflected_damage, is_reflected=True)
 
     def regen_hp(self) -> None:
         """Regenerates hp according to the regen stat, modified by the `Lifedrain Inhalers` attribute.
         """
-        inhaler_contrib = ((self.attributes["lifedrain_inhalers"] * 0.0008) * self.missing_hp)
-        regen_value = self.regen + inhaler_contrib
-        self.total_inhaler += inhaler_contrib
-        self.heal_hp(regen_value, 'regen')
+        if self._inhaler_coeff:
+            inhaler_contrib = self._inhaler_coeff * self.missing_hp
+            self.total_inhaler += inhaler_contrib
+            self.heal_hp(self.regen + inhaler_contrib, 'regen')
+        else:
+            self.heal_hp(self.regen, 'regen')
+
+    def complete_stage(self, stages: int = 1) -> None:
+        """Actions to take when the hunter completes a stage. Refreshes the stage-dependent stats when entering or
+        leaving a boss stage and when the catch-up bonus ends.
+
+        Args:
+            stages (int, optional): The number of stages to complete. Defaults to 1.
+        """
+        boss, catching_up = self.is_boss_stage, self.catching_up
+        super(Borge, self).complete_stage(stages)
+        if self.is_boss_stage != boss or self.catching_up != catching_up:
+            self._refresh_stage_stats()
 
     ### SPECIALS
     def on_kill(self, loot_type: str = None) -> None:
         """Actions to take when the hunter kills an enemy. Loot is handled by the parent class.
         """
         super(Borge, self).on_kill(loot_type)
-        if random.random() < self.effect_chance and (ua := self.talents["unfair_advantage"]):
+        if (ua := self._unfair_advantage) and rand() < self.effect_chance:
             # Talent: Unfair Advantage
             potion_healing = self.max_hp * (ua * 0.02)
             self.heal_hp(potion_healing, "potion")
@@ -1280,7 +1380,7 @@ class Borge(Hunter):
             enemy (Enemy): The enemy to stun.
         """
         stun_effect = 0.5 if is_boss else 1
-        stun_duration = self.talents['impeccable_impacts'] * 0.1 * stun_effect
+        stun_duration = self._stun_duration * stun_effect
         enemy.stun(stun_duration)
         self.total_stuntime_inflicted += stun_duration
 
@@ -1290,8 +1390,8 @@ class Borge(Hunter):
         Args:
             enemy (Enemy): The enemy to apply the effect to.
         """
-        stage_effect = 0.5 if self.current_stage % 100 == 0 and self.current_stage > 0 else 1
-        pog_effect = (self.talents["presence_of_god"] * 0.04) * stage_effect
+        stage_effect = 0.5 if self.is_boss_stage else 1
+        pog_effect = self._pog_coeff * stage_effect
         enemy.hp = enemy.max_hp * (1 - pog_effect)
 
     def apply_ood(self, enemy) -> None:
@@ -1300,15 +1400,15 @@ class Borge(Hunter):
         Args:
             enemy (Enemy): The enemy to apply the effect to.
         """
-        stage_effect = 0.5 if self.current_stage % 100 == 0 and self.current_stage > 0 else 1
-        ood_effect = self.talents["omen_of_defeat"] * 0.08 * stage_effect
+        stage_effect = 0.5 if self.is_boss_stage else 1
+        ood_effect = self._ood_coeff * stage_effect
         enemy.regen = enemy.regen * (1 - ood_effect)
 
     def apply_fow(self) -> None:
         """Apply the temporaryFires of War effect to Borge.
         """
-        self.fires_of_war = self.talents["fires_of_war"] * 0.1
-        logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t[FoW]\t{self.fires_of_war:>6.2f} sec')
+        self.fires_of_war = self._fires_of_war * 0.1
+        logging.debug('%s[@%5s]:\t[FoW]\t%6.2f sec', self._log_prefix, self.sim.elapsed_time, self.fires_of_war)
 
     def apply_trample(self, damage: float, current_target) -> int:
         """Apply the Trample effect to a number of enemies.
@@ -1330,9 +1430,9 @@ class Borge(Hunter):
             # make sure to kill current target first to properly manage the simulation queue
             current_target.kill()
             trample_kills += 1
-            alive_index = [i for i, e in enumerate(enemies) if not e.is_dead()]
-            for i in alive_index[:trample_power]:
-                enemies[i].kill()
+            # that kill already cleared the queued enemy actions, the rest only need their kill effects
+            for enemy in islice((e for e in enemies if not e.is_dead()), trample_power):
+                enemy.kill(clear_queue=False)
                 trample_kills += 1
             self.sim.refresh_enemies()
         return trample_kills
@@ -1347,53 +1447,14 @@ class Borge(Hunter):
         """
         return (
             self._power
-            * (1 + (self.missing_hp_pct * self.attributes["born_for_battle"] * 0.001))
-            * ((1.08 ** self.gems["attraction_catch-up"]) ** (1 + (self.gems["attraction_gem"] * 0.1) - 0.1) if self.catching_up else 1)
+            * (1 + (self.missing_hp_pct * self._born_for_battle * 0.001))
+            * self._catch_up_factor
         )
 
     @power.setter
     def power(self, value: float) -> None:
         self._power = value
 
-    @property
-    def damage_reduction(self) -> float:
-        """Getter for the damage_reduction attribute. Accounts for the Atlas Protocol attribute.
-
-        Returns:
-            float: The damage reduction of the hunter.
-        """
-        return (self._damage_reduction + self.attributes["atlas_protocol"] * 0.007) if (self.current_stage % 100 == 0 and self.current_stage > 0) else self._damage_reduction
-
-    @damage_reduction.setter
-    def damage_reduction(self, value: float) -> None:
-        self._damage_reduction = value
-
-    @property
-    def effect_chance(self) -> float:
-        """Getter for the effect_chance attribute. Accounts for the Atlas Protocol attribute.
-
-        Returns:
-            float: The effect chance of the hunter.
-        """
-        return (self._effect_chance + self.attributes["atlas_protocol"] * 0.014) if (self.current_stage % 100 == 0 and self.current_stage > 0) else self._effect_chance
-
-    @effect_chance.setter
-    def effect_chance(self, value: float) -> None:
-        self._effect_chance = value
-
-    @property
-    def special_chance(self) -> float:
-        """Getter for the special_chance attribute. Accounts for the Atlas Protocol attribute.
-
-        Returns:
-            float: The special chance of the hunter.
-        """
-        return (self._special_chance + self.attributes["atlas_protocol"] * 0.025) if (self.current_stage % 100 == 0 and self.current_stage > 0) else self._special_chance
-
-    @special_chance.setter
-    def special_chance(self, value: float) -> None:
-        self._special_chance = value
-
     @property
     def speed(self) -> float:
         """Getter for the speed attribute. Accounts for the Fires of War effect and resets it afterwards.
@@ -1401,16 +1462,10 @@ class Borge(Hunter):
         Returns:
             float: The speed of the hunter.
         """
-        current_speed = (self._speed * (1 - self.attributes["atlas_protocol"] * 0.04)) if (self.current_stage % 100 == 0 and self.current_stage > 0) else self._speed
-        current_speed /= (1.08 ** self.gems["attraction_catch-up"]) ** (1 + (self.gems["attraction_gem"] * 0.1) - 0.1) if self.catching_up else 1
-        current_speed -= self.fires_of_war
+        current_speed = self._stage_speed - self.fires_of_war
         self.fires_of_war = 0
         return current_speed
 
-    @speed.setter
-    def speed(self, value: float) -> None:
-        self._speed = value
-
     def get_results(self) -> List:
         """Fetch the hunter results for end-of-run statistics.
 
@@ -1428,6 +1483,20 @@ class Borge(Hunter):
         }
 
 class Ozzy(Hunter):
+    __slots__ = (
+        'scarab_dr', 'crit_chance', 'effect_chance',
+        'power', 'damage_reduction', 'special_chance', 'special_damage', 'speed', '_scarab_mult', '_dr_mult',
+        '_power', '_damage_reduction', '_special_chance', '_special_damage', '_speed',
+        'trickster_charges', 'crippling_on_target', 'empowered_regen', '_pending_ms', '_pending_echo',
+        'total_multistrikes', 'total_ms_extra_damage', 'total_decay_damage', 'total_cripple_extra_damage',
+        'medusa_kills', 'total_trickster_evades', 'total_echo',
+        # combat-path constants, see __create__
+        '_half_effect', '_tricksters_boon', '_thousand_needles', '_stun_duration', '_echo_mult', '_omen_bonus',
+        '_crippling_shots', '_unfair_advantage', '_dod_chance', '_snek_empower', '_snek_regen_cut',
+        '_deal_with_death', '_cycle_of_death', '_catch_up_mult',
+    )
+    relic_aliases = Hunter.relic_aliases | {"r4": "disk_of_dawn", "r17": "bee_gone_companion_drone"}
+
     ### SETUP
     # Attribute unlock dependencies with point gate requirements:
     # Chain: 1 -> 2 -> 3
@@ -1613,7 +1682,9 @@ class Ozzy(Hunter):
         self.trickster_charges: int = 0
         self.crippling_on_target: int = 0
         self.empowered_regen: int = 0
-        self.attack_queue: List = []
+        # triggered attacks carried over to the next enemy via EVENT_HUNTER_SPECIAL; multistrikes resolve before echoes
+        self._pending_ms: int = 0
+        self._pending_echo: int = 0
 
         # statistics
         # offence
@@ -1641,18 +1712,12 @@ class Ozzy(Hunter):
         """
         self.load_build(config_dict)
         
-        # Calculate gadget multipliers (WASM-verified: ~0.3% per level + 0.2% bonus per 10 levels)
-        # WASM formula: (1 + level * 0.003) * (1.002 ** (level // 10))
-        def gadget_mult(level):
-            return (1 + level * 0.003) * (1.002 ** (level // 10))
-        
-        gadget_hp_mult = (
+        # Combined gadget multiplier, applies identically to hp, power and regen
+        gadget_stat_mult = (
             gadget_mult(self.gadgets.get("wrench_of_gore", 0)) *
             gadget_mult(self.gadgets.get("zaptron_533", 0)) *
             gadget_mult(self.gadgets.get("anchor_of_ages", 0))
         )
-        gadget_power_mult = gadget_hp_mult
-        gadget_regen_mult = gadget_hp_mult
         
         # Attribute multipliers (WASM-verified Jan 2026)
         # NOTE: timeless_mastery only affects LOOT (+16% per level), NOT HP/Power/Regen!
@@ -1672,6 +1737,7 @@ class Ozzy(Hunter):
         
         # Scarab gives separate multiplicative DR (applied in receive_damage)
         self.scarab_dr = self.attributes["blessings_of_the_scarab"] * 0.01  # +1% DR per level (WASM: b[69] * 0.01)
+        self._scarab_mult = 1 - self.scarab_dr
         
         # WASM Level Multiplier (lines 9182-9184):
         # vb = 1.001^level * 1.02^(level/10)
@@ -1683,9 +1749,9 @@ class Ozzy(Hunter):
         iridian_mult = 1.03 if self.bonuses.get("iridian_card", False) else 1.0
         
         # hp - WASM-verified: HP does NOT use level_mult!
-        # WASM formula: hp_base * lotl_mult * disk_mult * gadget_hp_mult * gem_hp_mult
+        # WASM formula: hp_base * lotl_mult * disk_mult * gadget_stat_mult * gem_hp_mult
         # Relic r4 = disk_of_dawn (+3% HP per level)
-        disk_of_dawn = self.relics.get("disk_of_dawn", 0) or self.relics.get("r4", 0)
+        disk_of_dawn = self.relics["disk_of_dawn"]
         self.max_hp = (
             (
                 16
@@ -1695,15 +1761,15 @@ class Ozzy(Hunter):
             * lotl_mult
             * talent_dump_mult
             * (1 + (disk_of_dawn * 0.03))
-            * gadget_hp_mult
+            * gadget_stat_mult
             * (1 + (0.03 * self.gems.get("innovation_node_#3", 0)))  # +3% HP from gem
             * iridian_mult  # Iridian Card: +3% HP
         )
         self.hp = self.max_hp
         # power - WASM: Power * level_mult * exo_power_mult * cat_power_mult * talent_dump_mult
         # Relic r17 = bee_gone_companion_drone (+3% Power per level)
-        bee_gone = self.relics.get("bee_gone_companion_drone", 0) or self.relics.get("r17", 0)
-        self.power = (
+        bee_gone = self.relics["bee_gone_companion_drone"]
+        self._power = (
             (
                 2
                 + (self.base_stats["power"] * (0.3 + 0.01 * (self.base_stats["power"] // 10)))
@@ -1714,7 +1780,7 @@ class Ozzy(Hunter):
             * talent_dump_mult
             * (1 + (bee_gone * 0.03))
             * (1 + (0.03 * self.gems.get("innovation_node_#3", 0)))
-            * gadget_power_mult
+            * gadget_stat_mult
             * iridian_mult  # Iridian Card: +3% Power
         )
         # regen - WASM-verified: NO level_mult! Uses +25% from innovation_gem3
@@ -1726,11 +1792,11 @@ class Ozzy(Hunter):
             # NOTE: No level_mult for Regen in WASM!
             * lotl_mult
             * talent_dump_mult
-            * gadget_regen_mult
+            * gadget_stat_mult
             * (1 + (0.25 * self.gems.get("innovation_node_#3", 0)))  # +25% Regen from gem
             * iridian_mult  # Iridian Card: +3% Regen
         )
-        self.damage_reduction = (
+        self._damage_reduction = (
             0
             + (self.base_stats["damage_reduction"] * 0.0035)
             + (self.attributes["wings_of_ibu"] * 0.026)
@@ -1752,7 +1818,7 @@ class Ozzy(Hunter):
             + (self.inscryptions.get("i92", 0) * 0.002)  # WASM: bb * 0.002
         )
         # special_chance - WASM: NO exo_special! Only base stats + inscryption + gem
-        self.special_chance = (
+        self._special_chance = (
             (
                 0.05
                 + (self.base_stats["special_chance"] * 0.0038)
@@ -1762,7 +1828,7 @@ class Ozzy(Hunter):
         )
         # NOTE: Ozzy has NO crit in WASM! Removing crit_chance entirely.
         # special_damage
-        self.special_damage = (
+        self._special_damage = (
             0.25
             + (self.base_stats["special_damage"] * 0.01)
         )
@@ -1773,7 +1839,7 @@ class Ozzy(Hunter):
         # NOTE: exo_piercers does NOT affect speed! Only blessings_of_the_cat does!
         # IRL CALIBRATION: User confirmed 1.74 sec with speed=36, TN=10, i36=5, cat=1
         # Coefficient adjusted from 0.02 to 0.0418 to match IRL
-        self.speed = (
+        self._speed = (
             (
                 4
                 - (self.base_stats["speed"] * 0.0418)
@@ -1784,162 +1850,244 @@ class Ozzy(Hunter):
         )
         # lifesteal
         self.lifesteal = (self.attributes["shimmering_scorpion"] * 0.033)
+        # materialize the build levels and effect sizes the combat path reads, so attacks skip the dict lookups.
+        # These mirror the build dicts: re-run __create__ after changing them.
+        self._half_effect = self.effect_chance / 2  # Trickster's Boon, Echo Bullets and Omen of Decay proc at 50%
+        self._tricksters_boon = self.talents["tricksters_boon"]
+        self._thousand_needles = self.talents["thousand_needles"]
+        self._stun_duration = self._thousand_needles * 0.05
+        self._echo_mult = self.talents["echo_bullets"] * 0.05
+        self._omen_bonus = self.talents["omen_of_decay"] * 0.03
+        self._crippling_shots = self.talents["crippling_shots"]
+        self._unfair_advantage = self.talents["unfair_advantage"]
+        self._dod_chance = self.attributes["dance_of_dashes"] * 0.15
+        self._snek_empower = 1 + (self.attributes["soul_of_snek"] * 0.15)
+        self._snek_regen_cut = self.attributes["soul_of_snek"] * 0.088
+        self._deal_with_death = self.attributes["deal_with_death"]
+        self._cycle_of_death = self.attributes["cycle_of_death"]
+        self._catch_up_mult = (1.08 ** self.gems["attraction_catch-up"]) ** (1 + (self.gems["attraction_gem"] * 0.1) - 0.1)
+        self._recompute_effective_stats()
+
+    def _recompute_effective_stats(self) -> None:
+        """Materialize the combat stats that depend on revives (Deal with Death, Cycle of Death) and on the
+        Attraction gem catch-up bonus. Both only change on revive or stage completion, so the attack path
+        reads plain attributes instead of re-deriving them on every access.
+        """
+        revived = self.times_revived
+        self.power = (
+            self._power
+            * (1 + (self._deal_with_death * 0.02 * revived))
+            * (self._catch_up_mult if self.catching_up else 1)
+        )
+        self.damage_reduction = self._damage_reduction + (self._deal_with_death * 0.016 * revived)
+        self._dr_mult = 1 - self.damage_reduction
+        self.special_chance = self._special_chance + (revived * self._cycle_of_death * 0.023)
+        self.special_damage = self._special_damage + (revived * self._cycle_of_death * 0.02)
+        self.speed = (
+            self._speed
+            / (self._catch_up_mult if self.catching_up else 1)
+        )
+
+    # empty build template; load_dummy() returns a per-section copy
+    _DUMMY_TEMPLATE = {
+        "meta": {
+            "hunter": "Ozzy",
+            "level": 0
+        },
+        "stats": {
+            "hp": 0,
+            "power": 0,
+            "regen": 0,
+            "damage_reduction": 0,
+            "evade_chance": 0,
+            "effect_chance": 0,
+            "special_chance": 0,
+            "special_damage": 0,
+            "speed": 0,
+        },
+        "talents": {
+            "death_is_my_companion": 0,
+            "tricksters_boon": 0,
+            "unfair_advantage": 0,
+            "thousand_needles": 0,
+            "omen_of_decay": 0,
+            "call_me_lucky_loot": 0,
+            "crippling_shots": 0,
+            "echo_bullets": 0,
+            "legacy_of_ultima": 0,
+        },
+        "attributes": {
+            "living_off_the_land": 0,
+            "exo_piercers": 0,
+            "wings_of_ibu": 0,
+            "timeless_mastery": 0,
+            "shimmering_scorpion": 0,
+            "extermination_protocol": 0,
+            "dance_of_dashes": 0,
+            "gift_of_medusa": 0,
+            "vectid_elixir": 0,
+            "soul_of_snek": 0,
+            "cycle_of_death": 0,
+            "deal_with_death": 0,
+            "blessings_of_the_cat": 0,
+            "blessings_of_the_scarab": 0,
+            "blessings_of_the_sisters": 0,
+        },
+        "inscryptions": {
+            "i31": 0, # 0.006 ozzy effect chance
+            "i32": 0, # 1.5 ozzy loot
+            "i33": 0, # 1.75 ozzy xp
+            "i36": 0, # 0.03 ozzy speed
+            "i37": 0, # 0.0111 ozzy dr
+            "i40": 0, # 0.005 ozzy multistrike chance
+            "i86": 0, # 0.002 ozzy DR (WASM)
+            "i92": 0, # 0.002 ozzy effect chance (WASM)
+        },
+        "mods": {
+        },
+        "relics": {
+            "disk_of_dawn": 0,
+            "bee_gone_companion_drone": 0,
+            "manifestation_core_titan": 0,
+        },
+        "gems": {
+            "attraction_gem": 0,
+            "attraction_catch-up": 0,
+            "attraction_node_#3": 0,
+            "innovation_node_#3" : 0,
+        },
+        "gadgets": {
+            "wrench_of_gore": 0,
+            "zaptron_533": 0,
+            "anchor_of_ages": 0,
+        },
+        "bonuses": {
+            "shard_milestone": 0,
+            "iap_travpack": False,
+            "diamond_loot": 0,
+            "diamond_revive": 0,
+            "ultima_multiplier": 1.0,
+        },
+    }
 
     @staticmethod
     def load_dummy() -> dict:
         """Create a dummy build dictionary with empty stats to compare against loaded configs.
+        Every section is a fresh copy of the class template, so callers are free to fill it in.
 
         Returns:
             dict: The dummy build dict.
         """
-        return {
-            "meta": {
-                "hunter": "Ozzy",
-                "level": 0
-            },
-            "stats": {
-                "hp": 0,
-                "power": 0,
-                "regen": 0,
-                "damage_reduction": 0,
-                "evade_chance": 0,
-                "effect_chance": 0,
-                "special_chance": 0,
-                "special_damage": 0,
-                "speed": 0,
-            },
-            "talents": {
-                "death_is_my_companion": 0,
-                "tricksters_boon": 0,
-                "unfair_advantage": 0,
-                "thousand_needles": 0,
-                "omen_of_decay": 0,
-                "call_me_lucky_loot": 0,
-                "crippling_shots": 0,
-                "echo_bullets": 0,
-                "legacy_of_ultima": 0,
-            },
-            "attributes": {
-                "living_off_the_land": 0,
-                "exo_piercers": 0,
-                "wings_of_ibu": 0,
-                "timeless_mastery": 0,
-                "shimmering_scorpion": 0,
-                "extermination_protocol": 0,
-                "dance_of_dashes": 0,
-                "gift_of_medusa": 0,
-                "vectid_elixir": 0,
-                "soul_of_snek": 0,
-                "cycle_of_death": 0,
-                "deal_with_death": 0,
-                "blessings_of_the_cat": 0,
-                "blessings_of_the_scarab": 0,
-                "blessings_of_the_sisters": 0,
-            },
-            "inscryptions": {
-                "i31": 0, # 0.006 ozzy effect chance
-                "i32": 0, # 1.5 ozzy loot
-                "i33": 0, # 1.75 ozzy xp
-                "i36": 0, # 0.03 ozzy speed
-                "i37": 0, # 0.0111 ozzy dr
-                "i40": 0, # 0.005 ozzy multistrike chance
-                "i86": 0, # 0.002 ozzy DR (WASM)
-                "i92": 0, # 0.002 ozzy effect chance (WASM)
-            },
-            "mods": {
-            },
-            "relics": {
-                "disk_of_dawn": 0,
-                "bee_gone_companion_drone": 0,
-                "manifestation_core_titan": 0,
-            },
-            "gems": {
-                "attraction_gem": 0,
-                "attraction_catch-up": 0,
-                "attraction_node_#3": 0,
-                "innovation_node_#3" : 0,
-            },
-            "gadgets": {
-                "wrench_of_gore": 0,
-                "zaptron_533": 0,
-                "anchor_of_ages": 0,
-            },
-            "bonuses": {
-                "shard_milestone": 0,
-                "iap_travpack": False,
-                "diamond_loot": 0,
-                "diamond_revive": 0,
-                "ultima_multiplier": 1.0,
-            },
-        }
+        return {section: dict(values) for section, values in Ozzy._DUMMY_TEMPLATE.items()}
 
     def attack(self, target) -> None:
-        """Attack the enemy unit.
+        """Attack the enemy unit. Multistrikes, echoes and stuns triggered by a normal attack resolve within the same
+        call; they only go through the simulation queue when the target dies first.
 
         Args:
             target (Enemy): The enemy to attack.
         """
-        # method handles all attacks: normal and triggered
-        if not self.attack_queue: # normal attacks
-            if random.random() < (self.effect_chance / 2) and self.talents["tricksters_boon"]:
-                # Talent: Trickster's Boon
-                self.trickster_charges += 1
-                self.total_effect_procs += 1
-                logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTRICKSTER")
-            if random.random() < self.special_chance:
-                # Stat: Multi-Strike
-                self.attack_queue.append('(MS)')
-                hpush(self.sim.queue, (0, 1, 'hunter_special'))
-            if random.random() < self.effect_chance and self.talents["thousand_needles"]:
-                # Talent: Thousand Needles, will call Hunter.apply_stun(). Only Ozzy's main attack can stun.
-                hpush(self.sim.queue, (0, 0, 'stun'))
-                self.total_effect_procs += 1
-            if random.random() < (self.effect_chance / 2) and self.talents["echo_bullets"]:
-                # Talent: Echo Bullets
-                self.attack_queue.append('(ECHO)')
-                hpush(self.sim.queue, (0, 2, 'hunter_special'))
-            damage = self.power
-            self.total_attacks += 1
-            atk_type = ''
-        else: # triggered attacks
-            atk_type = self.attack_queue.pop(0)
-            match atk_type:
-                case '(MS)':
-                    damage = self.power * self.special_damage
-                    self.total_ms_extra_damage += damage
-                    self.total_multistrikes += 1
-                case '(ECHO)':
-                    # WASM: Echo bullets CANNOT trigger multishot (a=1 skips triggers)
-                    damage = self.power * (self.talents["echo_bullets"] * 0.05)
-                    self.total_echo += 1
-                case _:
-                    raise ValueError(f'Unknown attack type: {atk_type}')
-        
+        # triggered attacks left over from a target that died before they could resolve
+        if self._pending_ms:
+            self._pending_ms -= 1
+            self._multistrike(target)
+            return
+        if self._pending_echo:
+            self._pending_echo -= 1
+            self._echo(target)
+            return
+        # normal attacks
+        if self._tricksters_boon and rand() < self._half_effect:
+            # Talent: Trickster's Boon
+            self.trickster_charges += 1
+            self.total_effect_procs += 1
+            logging.debug("%s[@%5s]:\tTRICKSTER", self._log_prefix, self.sim.elapsed_time)
+        # Stat: Multi-Strike
+        multistrike = rand() < self.special_chance
+        # Talent: Thousand Needles. Only Ozzy's main attack can stun.
+        stun = self._thousand_needles and rand() < self.effect_chance
+        if stun:
+            self.total_effect_procs += 1
+        # Talent: Echo Bullets
+        echo = self._echo_mult and rand() < self._half_effect
+        self.total_attacks += 1
+        self._strike(target, self.power, '')
+
+        # Resolve the triggered actions right away, in the order their queue priorities used to give them
+        # (stun -> multistrike -> echo). Once the target is dead they are queued instead, so they still carry
+        # over to the next enemy.
+        if stun:
+            if target.is_dead():
+                hpush(self.sim.queue, (0, 0, EVENT_STUN))
+            else:
+                self.apply_stun(target, self.is_boss_stage)
+        if multistrike:
+            if target.is_dead():
+                self._pending_ms += 1
+                hpush(self.sim.queue, (0, 1, EVENT_HUNTER_SPECIAL))
+            else:
+                self._multistrike(target)
+        if echo:
+            if target.is_dead():
+                self._pending_echo += 1
+                hpush(self.sim.queue, (0, 2, EVENT_HUNTER_SPECIAL))
+            else:
+                self._echo(target)
+
+    def _multistrike(self, target) -> None:
+        """Resolve a multistrike triggered by a normal attack.
+
+        Args:
+            target (Enemy): The enemy to attack.
+        """
+        damage = self.power * self.special_damage
+        self.total_ms_extra_damage += damage
+        self.total_multistrikes += 1
+        self._strike(target, damage, '(MS)')
+
+    def _echo(self, target) -> None:
+        """Resolve an Echo Bullets attack triggered by a normal attack.
+
+        Args:
+            target (Enemy): The enemy to attack.
+        """
+        # WASM: Echo bullets CANNOT trigger multishot (a=1 skips triggers)
+        damage = self.power * self._echo_mult
+        self.total_echo += 1
+        self._strike(target, damage, '(ECHO)')
+
+    def _strike(self, target, damage: float, atk_type: str) -> None:
+        """Deal a single hit to the target, applying the on-hit talents every attack type shares.
+
+        Args:
+            target (Enemy): The enemy to attack.
+            damage (float): The base damage of the hit.
+            atk_type (str): Attack type tag for logging, empty for normal attacks.
+        """
         # WASM-verified combat formulas (Jan 2026):
         # Crippling Shots = flat % HP damage: (crippling_stacks * 0.008 * enemy_hp), /10 on bosses
         # Omen of Decay = damage MULTIPLIER: (1 + omen * 0.03), procs on effect chance
         
         # crippling shots - flat % HP damage based on accumulated stacks
-        is_boss = self.current_stage % 100 == 0 and self.current_stage > 0
-        cripple_boss_reduction = 0.1 if is_boss else 1.0
+        cripple_boss_reduction = 0.1 if self.is_boss_stage else 1.0
         cripple_damage = target.hp * (self.crippling_on_target * 0.008) * cripple_boss_reduction
         self.crippling_on_target = 0
         
         # omen of decay - damage multiplier that procs on effect chance (50% effect for omen)
-        omen_multiplier = 1.0
-        if self.talents["omen_of_decay"] and random.random() < (self.effect_chance / 2):
-            omen_multiplier = 1 + (self.talents["omen_of_decay"] * 0.03)
+        omen_bonus = self._omen_bonus if self._omen_bonus and rand() < self._half_effect else 0.0
+        if omen_bonus:
             self.total_effect_procs += 1
         
         # Final damage = (base damage + cripple HP%) * omen multiplier
-        omen_damage = (damage + cripple_damage) * (omen_multiplier - 1)  # Track bonus from omen
-        final_damage = (damage + cripple_damage) * omen_multiplier
+        base_damage = damage + cripple_damage
+        omen_damage = base_damage * omen_bonus  # Track bonus from omen
+        final_damage = base_damage * (1 + omen_bonus)
         
-        logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{final_damage:>6.2f} {atk_type} CRIP: {cripple_damage:>6.2f} OMEN: x{omen_multiplier:.2f}")
+        logging.debug("%s[@%5s]:\tATTACK\t%6.2f %s CRIP: %6.2f OMEN: x%.2f", self._log_prefix, self.sim.elapsed_time, final_damage, atk_type, cripple_damage, 1 + omen_bonus)
         super(Ozzy, self).attack(target, final_damage)
         self.total_decay_damage += omen_damage
         self.total_cripple_extra_damage += cripple_damage
-        if atk_type == '':
+        if not atk_type:  # normal attack
             self.total_damage += cripple_damage
 
         # on_attack() effects
@@ -1947,12 +2095,12 @@ class Ozzy(Hunter):
         # WASM: Soul of Snek also empowers lifesteal during Vectid buff!
         lifesteal_amount = damage * self.lifesteal
         if self.empowered_regen > 0:
-            lifesteal_amount *= 1 + (self.attributes["soul_of_snek"] * 0.15)
+            lifesteal_amount *= self._snek_empower
         self.heal_hp(lifesteal_amount, 'steal')
-        if random.random() < self.effect_chance and (cs := self.talents["crippling_shots"]):
+        if (cs := self._crippling_shots) and rand() < self.effect_chance:
             # Talent: Crippling Shots, can proc on any attack
             self.crippling_on_target += cs
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tCRIPPLE\t+{cs}")
+            logging.debug("%s[@%5s]:\tCRIPPLE\t+%s", self._log_prefix, self.sim.elapsed_time, cs)
             self.total_effect_procs += 1
         # Note: on_kill() is called by Enemy.on_death() - no duplicate call needed here
 
@@ -1970,44 +2118,43 @@ class Ozzy(Hunter):
             damage (float): The amount of damage to receive.
             is_crit (bool): Whether the attack was a critical hit or not.
         """
-        from units import Boss
-        boss_max_enrage = isinstance(attacker, Boss) and getattr(attacker, 'max_enrage', False)
+        boss_max_enrage = attacker.max_enrage
         
         # WASM Step 1: Check trickster charges FIRST (disabled at max enrage)
         if self.trickster_charges and not boss_max_enrage:
             self.trickster_charges -= 1
             self.total_trickster_evades += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE (TRICKSTER)')
+            logging.debug('%s[@%5s]:\tEVADE (TRICKSTER)', self._log_prefix, self.sim.elapsed_time)
             # Evaded via trickster - no damage, no Dance of Dashes proc
             return
         
         # WASM Step 2: Check normal evade (disabled at max enrage)
-        if not boss_max_enrage and random.random() < self.evade_chance:
+        if not boss_max_enrage and rand() < self.evade_chance:
             self.total_evades += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE')
+            logging.debug('%s[@%5s]:\tEVADE', self._log_prefix, self.sim.elapsed_time)
             # Evaded normally - no damage, no Dance of Dashes proc
             return
         
         # WASM Step 3: Failed to evade - take damage
         # Apply scarab DR (WASM: separate multiplicative DR)
-        scarab_reduced_damage = damage * (1 - self.scarab_dr)
-        mitigated_damage = scarab_reduced_damage * (1 - self.damage_reduction)
+        scarab_reduced_damage = damage * self._scarab_mult
+        mitigated_damage = scarab_reduced_damage * self._dr_mult
         self.hp -= mitigated_damage
         self.total_taken += mitigated_damage
         self.total_mitigated += (scarab_reduced_damage - mitigated_damage)
         self.total_attacks_suffered += 1
         
         if boss_max_enrage:
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f} (MAX ENRAGE - no evade), {self.hp:.2f} HP left")
+            logging.debug("%s[@%5s]:\tTAKE\t%6.2f (MAX ENRAGE - no evade), %.2f HP left", self._log_prefix, self.sim.elapsed_time, mitigated_damage, self.hp)
         else:
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
+            logging.debug("%s[@%5s]:\tTAKE\t%6.2f, %.2f HP left", self._log_prefix, self.sim.elapsed_time, mitigated_damage, self.hp)
         
         # WASM Step 4: Dance of Dashes - ONLY when you take a crit (inside failed evade branch)
         if is_crit:
-            if (dod := self.attributes["dance_of_dashes"]) and random.random() < dod * 0.15:
+            if self._dod_chance and rand() < self._dod_chance:
                 self.trickster_charges += 1
                 self.total_effect_procs += 1
-                logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDANCE OF DASHES - gained trickster charge')
+                logging.debug('%s[@%5s]:\tDANCE OF DASHES - gained trickster charge', self._log_prefix, self.sim.elapsed_time)
         
         if self.is_dead():
             self.on_death()
@@ -2022,9 +2169,22 @@ class Ozzy(Hunter):
             self.hp = self.max_hp * 0.8
             self.revive_log.append(self.current_stage)
             self.times_revived += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tREVIVED, {total_revives - self.times_revived} left')
+            self._recompute_effective_stats()
+            logging.debug('%s[@%5s]:\tREVIVED, %s left', self._log_prefix, self.sim.elapsed_time, total_revives - self.times_revived)
         else:
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDIED\n')
+            logging.debug('%s[@%5s]:\tDIED\n', self._log_prefix, self.sim.elapsed_time)
+
+    def complete_stage(self, stages: int = 1) -> None:
+        """Actions to take when the hunter completes a stage. Refreshes the effective stats when their inputs changed,
+        i.e. on leaving the catch-up stages and on the max_stage revive lockout.
+
+        Args:
+            stages (int, optional): The number of stages to complete. Defaults to 1.
+        """
+        catching_up, revived = self.catching_up, self.times_revived
+        super(Ozzy, self).complete_stage(stages)
+        if self.catching_up != catching_up or self.times_revived != revived:
+            self._recompute_effective_stats()
 
     def regen_hp(self) -> None:
         """Regenerates hp according to the regen stat, modified by Vectid Elixir + Soul of Snek.
@@ -2035,7 +2195,7 @@ class Ozzy(Hunter):
         regen_value = self.regen
         if self.empowered_regen > 0:
             # WASM: Soul of Snek empowers regen during Vectid buff, not Vectid itself!
-            regen_value *= 1 + (self.attributes["soul_of_snek"] * 0.15)
+            regen_value *= self._snek_empower
             self.empowered_regen -= 1
         self.heal_hp(regen_value, 'regen')
 
@@ -2044,7 +2204,7 @@ class Ozzy(Hunter):
         """Actions to take when the hunter kills an enemy. Loot is handled by the parent class.
         """
         super(Ozzy, self).on_kill(loot_type)
-        if random.random() < self.effect_chance and (ua := self.talents["unfair_advantage"]):
+        if (ua := self._unfair_advantage) and rand() < self.effect_chance:
             # Talent: Unfair Advantage
             potion_healing = self.max_hp * (ua * 0.02)
             self.heal_hp(potion_healing, "potion")
@@ -2060,7 +2220,7 @@ class Ozzy(Hunter):
             enemy (Enemy): The enemy to stun.
         """
         stun_effect = 0.5 if is_boss else 1
-        stun_duration = self.talents['thousand_needles'] * 0.05 * stun_effect
+        stun_duration = self._stun_duration * stun_effect
         enemy.stun(stun_duration)
         self.total_stuntime_inflicted += stun_duration
 
@@ -2070,7 +2230,7 @@ class Ozzy(Hunter):
         Args:
             enemy (Enemy): The enemy to apply the effect to.
         """
-        ood_effect = self.attributes["soul_of_snek"] * 0.088
+        ood_effect = self._snek_regen_cut
         enemy.regen = enemy.regen * (1 - ood_effect)
 
     def apply_medusa(self, enemy) -> None:
@@ -2089,78 +2249,6 @@ class Ozzy(Hunter):
         # WASM coefficient is 0.06, not 0.05!
         enemy.medusa_anti_regen = self.regen * self.attributes["gift_of_medusa"] * 0.06
 
-    @property
-    def power(self) -> float:
-        """Getter for the power attribute. Accounts for the Deal with Death effect.
-
-        Returns:
-            float: The power of the hunter.
-        """
-        return (
-            self._power
-            * (1 + (self.attributes["deal_with_death"] * 0.02 * self.times_revived))
-            * ((1.08 ** self.gems["attraction_catch-up"]) ** (1 + (self.gems["attraction_gem"] * 0.1) - 0.1) if self.catching_up else 1)
-        )
-
-    @power.setter
-    def power(self, value: float) -> None:
-        self._power = value
-    
-    @property
-    def damage_reduction(self) -> float:
-        """Getter for the damage_reduction attribute. Accounts for the Deal with Death effect.
-
-        Returns:
-            float: The damage_reduction of the hunter.
-        """
-        return self._damage_reduction + (self.attributes["deal_with_death"] * 0.016 * self.times_revived)
-
-    @damage_reduction.setter
-    def damage_reduction(self, value: float) -> None:
-        self._damage_reduction = value
-
-    @property
-    def special_chance(self) -> float:
-        """Getter for the special_chance attribute. Accounts for the Cycle of Death effect.
-
-        Returns:
-            float: The special_chance of the hunter.
-        """
-        return self._special_chance + (self.times_revived * self.attributes["cycle_of_death"] * 0.023)
-
-    @special_chance.setter
-    def special_chance(self, value: float) -> None:
-        self._special_chance = value
-
-    @property
-    def special_damage(self) -> float:
-        """Getter for the special_damage attribute. Accounts for the Cycle of Death effect.
-
-        Returns:
-            float: The special_chance of the hunter.
-        """
-        return self._special_damage + (self.times_revived * self.attributes["cycle_of_death"] * 0.02)
-
-    @special_damage.setter
-    def special_damage(self, value: float) -> None:
-        self._special_damage = value
-
-    @property
-    def speed(self) -> float:
-        """Getter for the speed attribute. Accounts for the Attraction gem catch-up effect.
-
-        Returns:
-            float: The speed of the hunter.
-        """
-        return (
-            self._speed
-            / ((1.08 ** self.gems["attraction_catch-up"]) ** (1 + (self.gems["attraction_gem"] * 0.1) - 0.1) if self.catching_up else 1)
-        )
-
-    @speed.setter
-    def speed(self, value: float) -> None:
-        self._speed = value
-
     def get_results(self) -> List:
         """Fetch the hunter results for end-of-run statistics.
 
@@ -2185,6 +2273,16 @@ class Knox(Hunter):
     NOTE: This is a simplified implementation for build optimization purposes.
     Some mechanics like Hundred Souls stacking are not fully simulated.
     """
+    __slots__ = (
+        'damage_reduction', '_dr_mult', 'block_chance', 'effect_chance', 'charge_chance', 'charge_gained',
+        'passive_charge_rate', 'reload_time', 'speed', 'special_chance', 'special_damage',
+        'salvo_projectiles', 'power', '_power', 'hundred_souls',
+        'total_ghost_bullets', 'total_ghost_bullet_damage', 'total_finishing_moves', 'total_charges',
+        'total_blocked',
+        # combat-path constants, see __create__
+        '_ghost_chance', '_fm_chance', '_ua_heal_frac', '_calypso_chance', '_pog_coeff', '_ood_coeff',
+    )
+
     ### SETUP
     # Attribute unlock dependencies for Knox:
     # - release_the_kraken (1) MUST have at least 1 point before 2-4 can be unlocked
@@ -2308,10 +2406,10 @@ class Knox(Hunter):
 
     def __init__(self, config_dict: Dict):
         super(Knox, self).__init__(name='Knox')
+        # Knox-specific stats, needed by __create__ for the effective power
+        self.hundred_souls: int = 0
         self.__create__(config_dict)
 
-        # Knox-specific stats
-        self.hundred_souls: int = 0
         # Note: salvo_projectiles is set in __create__ based on config (base 3 + upgrades)
         
         # statistics
@@ -2332,47 +2430,40 @@ class Knox(Hunter):
             config_dict (dict): Build config dictionary object.
         """
         self.load_build(config_dict)
-        
-        # Calculate gadget multipliers (WASM-verified: ~0.3% per level + 0.2% bonus per 10 levels)
-        # WASM formula: (1 + level * 0.003) * (1.002 ** (level // 10))
-        def gadget_mult(level):
-            return (1 + level * 0.003) * (1.002 ** (level // 10))
-        
-        gadget_hp_mult = (
-            gadget_mult(self.gadgets.get("wrench_of_gore", 0)) *
-            gadget_mult(self.gadgets.get("zaptron_533", 0)) *
-            gadget_mult(self.gadgets.get("anchor_of_ages", 0))
-        )
-        gadget_power_mult = gadget_hp_mult
-        gadget_regen_mult = gadget_hp_mult
+        # NOTE: Gadgets do NOT affect Knox hp, power or regen in WASM, so there is no gadget multiplier here
+        base_hp = self.base_stats["hp"]
+        base_power = self.base_stats["power"]
+        base_regen = self.base_stats["regen"]
+        kraken_mult = 1 + (self.attributes["release_the_kraken"] * 0.005)  # Release the Kraken: hp and power
         
         # hp - Knox formula (WASM-verified: 20 + hp * (2 + hp/50))
         # Note: Gadget does NOT affect Knox HP in WASM
         self.max_hp = (
             (
                 20  # Base HP
-                + (self.base_stats["hp"] * (2.0 + self.base_stats["hp"] / 50))
+                + (base_hp * (2.0 + base_hp / 50))
             )
-            * (1 + (self.attributes["release_the_kraken"] * 0.005))
+            * kraken_mult
             * (1 + (self.relics.get("disk_of_dawn", 0) * 0.03))
         )
         self.hp = self.max_hp
         
         # power - Knox formula (WASM-verified: 1.2 + atk * (0.06 + atk/1000))
         # Note: Gadget does NOT affect Knox Power in WASM
-        self.power = (
+        self._power = (
             (
                 1.2  # Base power
-                + (self.base_stats["power"] * (0.06 + self.base_stats["power"] / 1000))
+                + (base_power * (0.06 + base_power / 1000))
             )
-            * (1 + (self.attributes["release_the_kraken"] * 0.005))
+            * kraken_mult
         )
+        self._refresh_power()
         
         # regen - Knox formula (WASM-verified: 0.05 + regen * (0.01 + regen * 0.00075))
         # Note: Gadget and Kraken do NOT affect Knox Regen in WASM
         self.regen = (
             0.05  # Base regen
-            + (self.base_stats["regen"] * (0.01 + self.base_stats["regen"] * 0.00075))
+            + (base_regen * (0.01 + base_regen * 0.00075))
         )
         
         # damage_reduction
@@ -2381,6 +2472,7 @@ class Knox(Hunter):
             + (self.base_stats["damage_reduction"] * 0.01)
             + (self.attributes.get("a_pirates_life_for_knox", 0) * 0.009)  # +0.9% DR
         )
+        self._dr_mult = 1 - self.damage_reduction
         
         # block_chance (Knox's unique defensive stat instead of evade)
         self.block_chance = (
@@ -2438,84 +2530,96 @@ class Knox(Hunter):
         
         # lifesteal (Knox might not have this, set to 0)
         self.lifesteal = 0
+        # materialize the talent effects the combat path reads, so salvos and kills skip the dict lookups.
+        # These mirror the build dicts: re-run __create__ after changing them.
+        self._ghost_chance = self.talents["ghost_bullets"] * 0.0667
+        self._fm_chance = self.effect_chance * 2 if self.talents["finishing_move"] > 0 else 0  # Finishing Move procs at 2x effect chance
+        self._ua_heal_frac = self.talents["unfair_advantage"] * 0.02
+        self._calypso_chance = self.effect_chance * 2.5 if self.talents["calypsos_advantage"] > 0 else 0
+        self._pog_coeff = self.talents["presence_of_god"] * 0.03
+        self._ood_coeff = self.talents["omen_of_defeat"] * 0.08
+
+    # empty build template; load_dummy() returns a per-section copy
+    _DUMMY_TEMPLATE = {
+        "meta": {
+            "hunter": "Knox",
+            "level": 0
+        },
+        "stats": {
+            "hp": 0,
+            "power": 0,
+            "regen": 0,
+            "damage_reduction": 0,
+            "block_chance": 0,
+            "effect_chance": 0,
+            "charge_chance": 0,
+            "charge_gained": 0,
+            "reload_time": 0,
+            "projectiles_per_salvo": 0,
+        },
+        "talents": {
+            "death_is_my_companion": 0,
+            "calypsos_advantage": 0,
+            "unfair_advantage": 0,
+            "ghost_bullets": 0,
+            "omen_of_defeat": 0,
+            "call_me_lucky_loot": 0,
+            "presence_of_god": 0,
+            "finishing_move": 0,
+            "legacy_of_ultima": 0,
+        },
+        "attributes": {
+            "release_the_kraken": 0,
+            "space_pirate_armory": 0,
+            "soul_amplification": 0,
+            "serious_efficiency": 0,
+            "fortification_elixir": 0,
+            "a_pirates_life_for_knox": 0,
+            "dead_men_tell_no_tales": 0,
+            "passive_charge_tank": 0,
+            "shield_of_poseidon": 0,
+            "timeless_mastery": 0,
+        },
+        "inscryptions": {
+            "i_knox_hp": 0,
+            "i_knox_power": 0,
+            "i_knox_block": 0,
+            "i_knox_charge": 0,
+            "i_knox_reload": 0,
+        },
+        "mods": {},
+        "relics": {
+            "disk_of_dawn": 0,
+        },
+        "gems": {
+            "attraction_gem": 0,
+            "attraction_catch-up": 0,
+            "attraction_node_#3": 0,
+            "innovation_node_#3": 0,
+        },
+        "gadgets": {
+            "wrench_of_gore": 0,
+            "zaptron_533": 0,
+            "anchor_of_ages": 0,
+        },
+        "bonuses": {
+            "shard_milestone": 0,
+            "iap_travpack": False,
+            "diamond_loot": 0,
+            "diamond_revive": 0,
+            "ultima_multiplier": 1.0,
+        },
+    }
 
     @staticmethod
     def load_dummy() -> dict:
         """Create a dummy build dictionary with empty stats.
+        Every section is a fresh copy of the class template, so callers are free to fill it in.
 
         Returns:
             dict: The dummy build dict.
         """
-        return {
-            "meta": {
-                "hunter": "Knox",
-                "level": 0
-            },
-            "stats": {
-                "hp": 0,
-                "power": 0,
-                "regen": 0,
-                "damage_reduction": 0,
-                "block_chance": 0,
-                "effect_chance": 0,
-                "charge_chance": 0,
-                "charge_gained": 0,
-                "reload_time": 0,
-                "projectiles_per_salvo": 0,
-            },
-            "talents": {
-                "death_is_my_companion": 0,
-                "calypsos_advantage": 0,
-                "unfair_advantage": 0,
-                "ghost_bullets": 0,
-                "omen_of_defeat": 0,
-                "call_me_lucky_loot": 0,
-                "presence_of_god": 0,
-                "finishing_move": 0,
-                "legacy_of_ultima": 0,
-            },
-            "attributes": {
-                "release_the_kraken": 0,
-                "space_pirate_armory": 0,
-                "soul_amplification": 0,
-                "serious_efficiency": 0,
-                "fortification_elixir": 0,
-                "a_pirates_life_for_knox": 0,
-                "dead_men_tell_no_tales": 0,
-                "passive_charge_tank": 0,
-                "shield_of_poseidon": 0,
-                "timeless_mastery": 0,
-            },
-            "inscryptions": {
-                "i_knox_hp": 0,
-                "i_knox_power": 0,
-                "i_knox_block": 0,
-                "i_knox_charge": 0,
-                "i_knox_reload": 0,
-            },
-            "mods": {},
-            "relics": {
-                "disk_of_dawn": 0,
-            },
-            "gems": {
-                "attraction_gem": 0,
-                "attraction_catch-up": 0,
-                "attraction_node_#3": 0,
-                "innovation_node_#3": 0,
-            },
-            "gadgets": {
-                "wrench_of_gore": 0,
-                "zaptron_533": 0,
-                "anchor_of_ages": 0,
-            },
-            "bonuses": {
-                "shard_milestone": 0,
-                "iap_travpack": False,
-                "diamond_loot": 0,
-                "diamond_revive": 0,
-                "ultima_multiplier": 1.0,
-            },
-        }
+        return {section: dict(values) for section, values in Knox._DUMMY_TEMPLATE.items()}
 
     def attack(self, target) -> None:
         """Attack the enemy with a salvo of projectiles.
@@ -2525,47 +2629,51 @@ class Knox(Hunter):
         """
         # Calculate number of projectiles in this salvo
         num_projectiles = self.salvo_projectiles
-        base_projectiles = num_projectiles  # Track base for extra damage calc
-        
-        # Ghost Bullets - chance for extra projectile
-        if self.talents["ghost_bullets"] > 0:
-            ghost_chance = self.talents["ghost_bullets"] * 0.0667
-            if random.random() < ghost_chance:
-                num_projectiles += 1
-                self.total_ghost_bullets += 1
         
+        # Ghost Bullets - chance for one extra projectile
+        ghost_bullet = self._ghost_chance and rand() < self._ghost_chance
+        if ghost_bullet:
+            num_projectiles += 1
+            self.total_ghost_bullets += 1
+        
+        # Each projectile deals FULL attack power (not split!)
+        # This is how Knox can clear stages quickly with enough bullets
+        power = self.power
+        charge_chance = self.charge_chance
+        charged_damage = power * (1 + self.charge_gained)
         total_damage = 0
-        for i in range(num_projectiles):
-            # Each projectile deals FULL attack power (not split!)
-            # This is how Knox can clear stages quickly with enough bullets
-            bullet_damage = self.power
-            
+        charges = 0
+        for _ in range(num_projectiles - 1):
             # Check for charge (Knox's crit equivalent)
-            if random.random() < self.charge_chance:
-                bullet_damage *= (1 + self.charge_gained)
-                self.total_charges += 1
-            
-            # Finishing Move on last bullet
-            if i == num_projectiles - 1 and self.talents["finishing_move"] > 0:
-                if random.random() < (self.effect_chance * 2):
-                    bullet_damage *= self.special_damage
-                    self.total_finishing_moves += 1
-            
-            total_damage += bullet_damage
-        
-        # Track extra salvo damage from ghost bullets
-        if num_projectiles > base_projectiles:
-            extra_projectile_count = num_projectiles - base_projectiles
-            damage_per_projectile = total_damage / num_projectiles
-            self.total_ghost_bullet_damage += damage_per_projectile * extra_projectile_count
+            if rand() < charge_chance:
+                total_damage += charged_damage
+                charges += 1
+            else:
+                total_damage += power
+        
+        # last bullet: same charge roll, then Finishing Move
+        bullet_damage = power
+        if rand() < charge_chance:
+            bullet_damage = charged_damage
+            charges += 1
+        if self._fm_chance and rand() < self._fm_chance:
+            bullet_damage *= self.special_damage
+            self.total_finishing_moves += 1
+        total_damage += bullet_damage
+        self.total_charges += charges
+        
+        # Track extra salvo damage from ghost bullets: the extra projectile's average share of the salvo
+        if ghost_bullet:
+            self.total_ghost_bullet_damage += total_damage / num_projectiles
             
-        logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tSALVO\t{total_damage:>6.2f} ({num_projectiles} projectiles)")
+        logging.debug("%s[@%5s]:\tSALVO\t%6.2f (%s projectiles)", self._log_prefix, self.sim.elapsed_time, total_damage, num_projectiles)
         super(Knox, self).attack(target, total_damage)
         self.total_damage += total_damage
         self.total_attacks += 1
 
         # on_attack() effects
-        self.heal_hp(total_damage * self.lifesteal, 'steal') if self.lifesteal > 0 else None
+        if self.lifesteal:
+            self.heal_hp(total_damage * self.lifesteal, 'steal')
 
     def receive_damage(self, attacker, damage: float, is_crit: bool) -> None:
         """Receive damage from an attack. Knox uses block instead of evade.
@@ -2576,20 +2684,20 @@ class Knox(Hunter):
             is_crit (bool): Whether the attack was a critical hit.
         """
         # Check for block first
-        if random.random() < self.block_chance:
+        if rand() < self.block_chance:
             blocked_amount = damage * 0.5  # Block reduces damage by 50%
             self.total_blocked += blocked_amount
             damage = damage - blocked_amount
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tBLOCK\t{blocked_amount:>6.2f}')
+            logging.debug('%s[@%5s]:\tBLOCK\t%6.2f', self._log_prefix, self.sim.elapsed_time, blocked_amount)
         
         # Apply remaining damage through parent class
         if damage > 0:
-            mitigated_damage = damage * (1 - self.damage_reduction)
+            mitigated_damage = damage * self._dr_mult
             self.hp -= mitigated_damage
             self.total_taken += mitigated_damage
             self.total_mitigated += (damage - mitigated_damage)
             self.total_attacks_suffered += 1
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
+            logging.debug("%s[@%5s]:\tTAKE\t%6.2f, %.2f HP left", self._log_prefix, self.sim.elapsed_time, mitigated_damage, self.hp)
             if self.is_dead():
                 self.on_death()
 
@@ -2597,15 +2705,19 @@ class Knox(Hunter):
         """Regenerates hp according to the regen stat, modified by Fortification Elixir after blocks.
         """
         # Fortification Elixir bonus regen after blocking (tracked via total_blocked)
+        # Inlined heal_hp(): regen ticks are the most frequent event, so skip the source dispatch.
         regen_value = self.regen
-        self.heal_hp(regen_value, 'regen')
+        effective_heal = min(regen_value, self.max_hp - self.hp)
+        self.hp += effective_heal
+        self.total_regen += effective_heal
+        logging.debug('%s[@%5s]:\tREGEN\t%6.2f (+%6.2f OVERHEAL)', self._log_prefix, self.sim.elapsed_time, effective_heal, regen_value - effective_heal)
 
     def on_kill(self, loot_type: str = None) -> None:
         """Actions to take when Knox kills an enemy."""
         super(Knox, self).on_kill(loot_type)
-        if random.random() < self.effect_chance and (ua := self.talents["unfair_advantage"]):
+        if self._ua_heal_frac and rand() < self.effect_chance:
             # Talent: Unfair Advantage
-            potion_healing = self.max_hp * (ua * 0.02)
+            potion_healing = self.max_hp * self._ua_heal_frac
             self.heal_hp(potion_healing, "potion")
             self.total_potion += potion_healing
             self.total_effect_procs += 1
@@ -2615,10 +2727,10 @@ class Knox(Hunter):
         super(Knox, self).complete_stage(stages)
         
         # Calypso's Advantage - chance to gain Hundred Souls on stage clear
-        if self.talents["calypsos_advantage"] > 0:
-            if random.random() < (self.effect_chance * 2.5):
-                self.hundred_souls += 1
-                self.total_effect_procs += 1
+        if self._calypso_chance and rand() < self._calypso_chance:
+            self.hundred_souls += 1
+            self._refresh_power()
+            self.total_effect_procs += 1
 
     def apply_ood(self, enemy) -> None:
         """Apply the Omen of Defeat effect to reduce enemy regen.
@@ -2626,8 +2738,8 @@ class Knox(Hunter):
         Args:
             enemy (Enemy): The enemy to apply the effect to.
         """
-        stage_effect = 0.5 if self.current_stage % 100 == 0 and self.current_stage > 0 else 1
-        ood_effect = self.talents["omen_of_defeat"] * 0.08 * stage_effect
+        stage_effect = 0.5 if self.is_boss_stage else 1
+        ood_effect = self._ood_coeff * stage_effect
         enemy.regen = enemy.regen * (1 - ood_effect)
 
     def apply_pog(self, enemy) -> None:
@@ -2636,19 +2748,15 @@ class Knox(Hunter):
         Args:
             enemy (Enemy): The enemy to apply the effect to.
         """
-        pog_effect = self.talents["presence_of_god"] * 0.03
+        pog_effect = self._pog_coeff
         enemy.power = enemy.power * (1 - pog_effect)
 
-    @property
-    def power(self) -> float:
-        """Getter for power, includes Hundred Souls bonus."""
-        base = self._power
+    def _refresh_power(self) -> None:
+        """Materialize the effective power, including the Hundred Souls bonus. Souls are only gained on stage clear,
+        so this runs from __create__ and complete_stage() instead of on every salvo.
+        """
         souls_bonus = 1 + (self.hundred_souls * 0.005)  # +0.5% per soul
-        return base * souls_bonus
-
-    @power.setter
-    def power(self, value: float) -> None:
-        self._power = value
+        self.power = self._power * souls_bonus
 
     def get_results(self) -> List:
         """Fetch the hunter results for end-of-run statistics.
@@ -5,12 +5,19 @@ Communicates results back via JSON file.
 import sys
 import json
 import time
-import copy
 import os
 import argparse
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import heapq
-import statistics
+from operator import itemgetter
+import random
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -26,6 +33,32 @@ def _log(msg):
         except:
             pass
 
+# Minimum wall-clock time between the progress updates written while builds are being generated
+PROGRESS_WRITE_INTERVAL = 0.25  # seconds
+
+def _write_progress(progress_file, progress_data):
+    """Write the progress file via a temp file + os.replace so the GUI never reads a partial write.
+    json.dumps() encodes in one shot and the file gets a single write, unlike json.dump()'s chunked writes.
+    """
+    temp_progress = progress_file + '.tmp'
+    with open(temp_progress, 'w') as f:
+        f.write(json.dumps(progress_data))
+    os.replace(temp_progress, progress_file)
+
+# Minimum wall-clock time between psutil memory readings used to size optimizer batches
+MEMORY_CHECK_INTERVAL = 2.0  # seconds
+_memory_check = [0.0, None]  # [monotonic time, percent] of the last reading
+
+def _memory_percent():
+    """System memory usage in percent, re-read at most once per MEMORY_CHECK_INTERVAL. None if psutil is missing."""
+    if not PSUTIL_AVAILABLE:
+        return None
+    now = time.monotonic()
+    if _memory_check[1] is None or now - _memory_check[0] >= MEMORY_CHECK_INTERVAL:
+        _memory_check[0] = now
+        _memory_check[1] = psutil.virtual_memory().percent
+    return _memory_check[1]
+
 def extend_elite_pattern(elite_talents, elite_attrs, generator, target_talents, target_attrs):
     """
     Extend an elite pattern from a previous tier to use more points.
@@ -34,8 +67,6 @@ def extend_elite_pattern(elite_talents, elite_attrs, generator, target_talents,
     talent/attribute points to reach the new tier's targets while preserving
     the core pattern that made the original build successful.
     """
-    import random
-    
     hunter_class = generator.hunter_class
     talents_list = list(generator.costs["talents"].keys())
     attrs_list = list(generator.costs["attributes"].keys())
@@ -63,13 +94,17 @@ def extend_elite_pattern(elite_talents, elite_attrs, generator, target_talents,
     # Find unlimited talents for fallback (but NOT unknown_talent)
     unlimited_talents = [t for t in talents_list if talent_max[t] == float('inf') and t != 'unknown_talent']
     
+    random_choice = random.choice
+    
     # === ADD TALENT POINTS ===
+    # (talent, level cap or None for unlimited) for the KNOWN talents, resolved once
+    known_talent_caps = [(t, None if talent_max[t] == float('inf') else int(talent_max[t]))
+                         for t in talents_list if t != 'unknown_talent']
     attempts = 0
     while talent_to_add > 0 and attempts < 1000:
         attempts += 1
         # Find KNOWN talents that can accept more points
-        valid = [t for t in talents_list 
-                 if t != 'unknown_talent' and (talent_max[t] == float('inf') or talents[t] < int(talent_max[t]))]
+        valid = [t for t, cap in known_talent_caps if cap is None or talents[t] < cap]
         
         # Only use unknown_talent as LAST RESORT
         if not valid:
@@ -78,13 +113,26 @@ def extend_elite_pattern(elite_talents, elite_attrs, generator, target_talents,
             else:
                 break
         
-        chosen = random.choice(valid)
+        chosen = random_choice(valid)
         talents[chosen] += 1
         talent_to_add -= 1
     
     # === ADD ATTRIBUTE POINTS ===
     deps = getattr(hunter_class, 'attribute_dependencies', {})
     exclusions = getattr(hunter_class, 'attribute_exclusions', [])
+    point_gates = getattr(hunter_class, 'attribute_point_gates', {})
+    
+    # Everything the validity checks need that doesn't change between attempts, resolved once per attribute:
+    # (attr, cost, level cap or None for unlimited, dependency (req, lvl) pairs, mutually exclusive partners,
+    #  points required elsewhere to unlock or None)
+    attr_checks = []
+    for attr in attrs_list:
+        cap = None if attr_max[attr] == float('inf') else int(attr_max[attr])
+        attr_deps = tuple(deps[attr].items()) if attr in deps else ()
+        partners = tuple(excl_pair[0] if excl_pair[1] == attr else excl_pair[1]
+                         for excl_pair in exclusions if attr in excl_pair)
+        attr_checks.append((attr, attr_costs[attr], cap, attr_deps, partners, point_gates.get(attr)))
+    attrs_get = attrs.get
     
     attempts = 0
     remaining = attr_to_add
@@ -92,37 +140,30 @@ def extend_elite_pattern(elite_talents, elite_attrs, generator, target_talents,
     while remaining > 0 and attempts < 5000:
         attempts += 1
         
+        # points spent so far; a gated attribute needs `gate` points on the other attributes
+        spent = elite_attr_spent + attr_to_add - remaining
+        
         # Find valid attributes to add to
         valid_attrs = []
-        for attr in attrs_list:
-            cost = attr_costs[attr]
+        for attr, cost, cap, attr_deps, partners, gate in attr_checks:
             if cost > remaining:
                 continue
-            # Check max - unlimited attrs (inf) always pass this check
-            if attr_max[attr] != float('inf'):
-                if attrs[attr] >= int(attr_max[attr]):
-                    continue
+            # Check max - unlimited attrs always pass this check
+            if cap is not None and attrs[attr] >= cap:
+                continue
             # Check dependencies
-            if attr in deps:
-                if not all(attrs.get(req, 0) >= lvl for req, lvl in deps[attr].items()):
-                    continue
-            # Check unlock requirements
-            if not generator._can_unlock_attribute(attr, attrs, attr_costs):
+            if attr_deps and not all(attrs_get(req, 0) >= lvl for req, lvl in attr_deps):
+                continue
+            # Check unlock requirements (points spent on the other attributes)
+            if gate is not None and spent - attrs[attr] * cost < gate:
                 continue
             # Check exclusions
-            excluded = False
-            for excl_pair in exclusions:
-                if attr in excl_pair:
-                    other = excl_pair[0] if excl_pair[1] == attr else excl_pair[1]
-                    if attrs.get(other, 0) > 0:
-                        excluded = True
-                        break
-            if excluded:
+            if partners and any(attrs_get(other, 0) > 0 for other in partners):
                 continue
             valid_attrs.append(attr)
         
         if valid_attrs:
-            chosen = random.choice(valid_attrs)
+            chosen = random_choice(valid_attrs)
             attrs[chosen] += 1
             remaining -= attr_costs[chosen]
         elif unlimited_attrs:
@@ -155,6 +196,9 @@ from gui_multi import BuildGenerator
 import rust_sim
 from typing import Dict
 
+_PYTHON_SIM_AVG_KEYS = ('kills', 'damage', 'damage_taken', 'attacks', 'elapsed_time', 'effect_procs', 'evades',
+                        'regenerated_hp', 'lifesteal', 'total_xp', 'total_loot', 'loot_common', 'loot_uncommon', 'loot_rare')
+
 def run_python_sim(config: Dict, hunter_class, num_sims: int) -> dict:
     """Run Python simulation and return aggregated stats."""
     results = []
@@ -164,54 +208,159 @@ def run_python_sim(config: Dict, hunter_class, num_sims: int) -> dict:
         result = sim.run()
         results.append(result)
     
-    # Aggregate results
-    def avg(key): return statistics.mean([r.get(key, 0) for r in results])
-    def total(key): return sum([r.get(key, 0) for r in results])
+    # Aggregate results - sums, stage min/max and survivors all in one pass over the runs
+    n = len(results)
+    sums = dict.fromkeys(_PYTHON_SIM_AVG_KEYS, 0)
+    stage_sum = 0
+    min_stage = max_stage = results[0]['final_stage']
+    survived = 0
+    for r in results:
+        stage = r['final_stage']
+        stage_sum += stage
+        if stage < min_stage:
+            min_stage = stage
+        elif stage > max_stage:
+            max_stage = stage
+        if stage > 0:
+            survived += 1
+        for key in _PYTHON_SIM_AVG_KEYS:
+            sums[key] += r.get(key, 0)
+    def avg(key): return sums[key] / n
+    avg_elapsed_time = avg('elapsed_time')
+    avg_loot = avg('total_loot')
     
     return {
-        'avg_stage': avg('final_stage'),
-        'min_stage': min(r['final_stage'] for r in results),
-        'max_stage': max(r['final_stage'] for r in results),
+        'avg_stage': stage_sum / n,
+        'min_stage': min_stage,
+        'max_stage': max_stage,
         'avg_kills': avg('kills'),
         'avg_damage': avg('damage'),
         'avg_damage_taken': avg('damage_taken'),
         'avg_attacks': avg('attacks'),
-        'avg_elapsed_time': avg('elapsed_time'),
+        'avg_elapsed_time': avg_elapsed_time,
         'avg_effect_procs': avg('effect_procs'),
         'avg_evades': avg('evades'),
         'avg_regen': avg('regenerated_hp'),
         'avg_lifesteal': avg('lifesteal'),
         # XP and Loot
         'avg_xp': avg('total_xp'),
-        'avg_loot': avg('total_loot'),
+        'avg_loot': avg_loot,
         'avg_loot_common': avg('loot_common'),
         'avg_loot_uncommon': avg('loot_uncommon'),
         'avg_loot_rare': avg('loot_rare'),
-        'avg_loot_per_hour': avg('total_loot') / avg('elapsed_time') * 3600 if avg('elapsed_time') > 0 else 0,
-        'survival_rate': len([r for r in results if r.get('final_stage', 0) > 0]) / len(results),
+        'avg_loot_per_hour': avg_loot / avg_elapsed_time * 3600 if avg_elapsed_time > 0 else 0,
+        'survival_rate': survived / n,
     }
 
-def python_simulate_batch(config_jsons, num_sims):
-    """Simulate a batch using Python."""
-    results = []
-    hunter_classes = {'Borge': Borge, 'Ozzy': Ozzy, 'Knox': Knox}
-    for config_json in config_jsons:
-        config = json.loads(config_json)
-        hunter_class = hunter_classes[config['hunter']]
-        result = run_python_sim(config, hunter_class, num_sims)
-        results.append(result)
-    return results
+_PYTHON_HUNTER_CLASSES = {'Borge': Borge, 'Ozzy': Ozzy, 'Knox': Knox}
+
+def _python_sim_worker(config, num_sims):
+    """Worker process for python_simulate_batch: simulate one build."""
+    return run_python_sim(config, _PYTHON_HUNTER_CLASSES[config['hunter']], num_sims)
+
+# Worker pool shared by every python_simulate_batch call of an optimization run: (executor, max_workers)
+_python_sim_pool = None
+
+def _get_python_sim_pool(num_processes):
+    """Return the run's worker pool, starting it on first use so later rounds don't pay process startup again."""
+    global _python_sim_pool
+    if _python_sim_pool is None or _python_sim_pool[1] != num_processes:
+        _shutdown_python_sim_pool()
+        _python_sim_pool = (ProcessPoolExecutor(max_workers=num_processes), num_processes)
+    return _python_sim_pool[0]
+
+def _shutdown_python_sim_pool():
+    """Stop the shared worker pool, if one was started."""
+    global _python_sim_pool
+    if _python_sim_pool is not None:
+        _python_sim_pool[0].shutdown()
+        _python_sim_pool = None
+
+def python_simulate_batch(configs, num_sims, num_processes=None):
+    """Simulate a batch using Python.
+    
+    Builds are independent and CPU-bound, so they are spread over num_processes worker processes.
+    None picks one per CPU core when there are more than 4 builds and more than 2 cores; -1 runs sequentially.
+    A frozen (PyInstaller) app always runs sequentially: spawned workers would start the GUI exe again.
+    """
+    if num_processes is None:
+        cpu_count = os.cpu_count() or 1
+        if getattr(sys, 'frozen', False):
+            num_processes = -1
+        else:
+            num_processes = cpu_count if len(configs) > 4 and cpu_count > 2 else -1
+    if num_processes > 0:
+        # a few chunks per worker keeps them all busy without paying IPC per build
+        chunksize = max(1, len(configs) // (num_processes * 4))
+        pool = _get_python_sim_pool(num_processes)
+        return list(pool.map(_python_sim_worker, configs, [num_sims] * len(configs), chunksize=chunksize))
+    return [_python_sim_worker(config, num_sims) for config in configs]
+
+def _similarity_key(config):
+    """Similarity key based on major talent/attribute allocations: the top 3 talents and top 3 attributes by level.
+    heapq.nlargest() keeps the tie order of a stable descending sort, without sorting the whole dict.
+    """
+    return (tuple(heapq.nlargest(3, config.get('talents', {}).items(), key=itemgetter(1))),
+            tuple(heapq.nlargest(3, config.get('attributes', {}).items(), key=itemgetter(1))))
+
+# Composite score weights: 70% stage + 30% normalized loot, with loot scaled to 300 stages (300 * 0.3 folded)
+_SCORE_STAGE_WEIGHT = 0.7
+_SCORE_LOOT_WEIGHT = 300 * 0.3
+_SCORE_LOOT_SCALE = 1e6  # loot/hour treated as maxed out at this value
+
+def _score_results(results, round_num, best_score_so_far):
+    """Score (item, result) pairs with the composite 70% stage + 30% normalized loot score.
+    item is passed through untouched (a config, or whatever the caller needs back with the score).
+    From round 3 on, builds below 30% of the best score so far are dropped.
+    Returns ([(item, result, score), ...], best_score_so_far).
+    """
+    scored = []
+    for item, result in results:
+        avg_stage = result.get('avg_stage', 0)
+        avg_loot = result.get('avg_loot_per_hour', 0)
+        
+        # Early termination: skip builds that are clearly suboptimal
+        # If we're in later rounds and this build is performing very poorly, don't waste time
+        if round_num >= 2:  # After first couple rounds
+            if best_score_so_far is not None and avg_stage < best_score_so_far * 0.3:  # Less than 30% of best
+                continue  # Skip this build entirely
+        
+        # Normalize loot to 0-1 scale (assuming max loot around 1e6 for normalization)
+        normalized_loot = min(avg_loot / _SCORE_LOOT_SCALE, 1.0)  # Cap at 1.0
+        
+        score = avg_stage * _SCORE_STAGE_WEIGHT + normalized_loot * _SCORE_LOOT_WEIGHT
+        scored.append((item, result, score))
+        
+        # Track best score for early termination
+        if best_score_so_far is None or score > best_score_so_far:
+            best_score_so_far = score
+    return scored, best_score_so_far
+
+def _sh_total_sims(num_builds, base_sims, rounds, survival_rate, eta=2):
+    """Simulations successive halving spends on num_builds builds: every round plus the final evaluation.
+    Sims per build grow by eta each round while the survivors shrink by survival_rate.
+    """
+    total = 0
+    surviving = num_builds
+    sims_per_build = base_sims
+    for _ in range(rounds + 1):  # rounds + final round
+        total += surviving * sims_per_build
+        surviving = max(1, int(surviving * survival_rate))
+        sims_per_build *= eta
+    return total
 
-def evaluate_builds_successive_halving(build_configs, base_sims=64, rounds=3, survival_rate=0.5, progress_file=None, tier_name="", total_sims=0, start_time=None, use_rust=True):
+def evaluate_builds_successive_halving(build_configs, base_sims=64, rounds=3, survival_rate=0.5, progress_file=None, tier_name="", total_sims=0, start_time=None, use_rust=True, batch_size=100, eta=2):
     """
     Evaluate builds using successive halving algorithm with optimizations.
     
     Args:
-        build_configs: List of JSON config strings
+        build_configs: List of build config dicts (passed to the backend as-is, no JSON round-trip)
         base_sims: Starting simulations per build
         rounds: Number of successive halving rounds
         survival_rate: Fraction of builds to keep each round
         use_rust: Whether to use Rust backend (True) or Python backend (False)
+        batch_size: Minimum number of builds per Rust simulate_batch call
+        eta: Factor the sims per build grow by after each round
     
     Returns:
         List of (config, score) tuples for surviving builds
@@ -226,8 +375,19 @@ def evaluate_builds_successive_halving(build_configs, base_sims=64, rounds=3, su
         _log(f"[DEBUG] No build_configs, returning empty\n")
         return []
     
+    # Load the progress file once; this function owns it until it returns, so
+    # later updates write the in-memory dict instead of re-reading the file
+    progress_data = None
+    if progress_file and os.path.exists(progress_file):
+        try:
+            with open(progress_file, 'r') as f:
+                progress_data = json.load(f)
+        except Exception as e:
+            _log(f"[DEBUG] Progress load error: {e}\n")
+    
     # Build similarity cache to avoid re-simulating very similar configurations
     similarity_cache = {}
+    best_score_so_far = None
     
     surviving_configs = build_configs[:]
     current_sims = base_sims
@@ -242,60 +402,41 @@ def evaluate_builds_successive_halving(build_configs, base_sims=64, rounds=3, su
         
         # === UPDATE PROGRESS AT START OF ROUND ===
         # This lets the GUI see the halving progression (5000 → 2500 → 1250 → ...)
-        if progress_file:
+        if progress_data is not None:
             try:
-                if os.path.exists(progress_file):
-                    with open(progress_file, 'r') as f:
-                        progress_data = json.load(f)
-                    
-                    # Show halving round info
-                    if round_num == rounds - 1:
-                        round_label = "Final"
-                    else:
-                        round_label = f"R{round_num+1}/{rounds}"
-                    progress_data['tier'] = f"{tier_name} {round_label}"
-                    progress_data['builds_in_generation'] = len(surviving_configs)
-                    
-                    # Atomic write
-                    temp_progress = progress_file + '.tmp'
-                    with open(temp_progress, 'w') as f:
-                        json.dump(progress_data, f)
-                    os.replace(temp_progress, progress_file)
-                    _log(f"[ROUND START] Updated progress: {tier_name} {round_label}: {len(surviving_configs)} builds\n")
-                    
-                    # Small delay to ensure GUI can poll this update
-                    # GUI polls every 500ms, so 100ms should be enough to be visible
-                    time.sleep(0.1)
+                # Show halving round info
+                if round_num == rounds - 1:
+                    round_label = "Final"
+                else:
+                    round_label = f"R{round_num+1}/{rounds}"
+                progress_data['tier'] = f"{tier_name} {round_label}"
+                progress_data['builds_in_generation'] = len(surviving_configs)
+                
+                _write_progress(progress_file, progress_data)
+                _log(f"[ROUND START] Updated progress: {tier_name} {round_label}: {len(surviving_configs)} builds\n")
+                
+                # Small delay to ensure GUI can poll this update
+                # GUI polls every 500ms, so 100ms should be enough to be visible
+                time.sleep(0.1)
             except Exception as e:
                 _log(f"[DEBUG] Round start progress update error: {e}\n")
         
         # Check similarity cache for very similar builds
         filtered_configs = []
+        filtered_keys = []  # similarity keys of the cache misses, reused when their results are cached
         cached_results = []
         cache_hits = 0
-        for config_json in surviving_configs:
-            config = json.loads(config_json)
-            # Create similarity key based on major talent/attribute allocations
-            talents = config.get('talents', {})
-            attrs = config.get('attributes', {})
-            
-            # Focus on top 3 talents and attributes for similarity
-            top_talents = sorted(talents.items(), key=lambda x: x[1], reverse=True)[:3]
-            top_attrs = sorted(attrs.items(), key=lambda x: x[1], reverse=True)[:3]
-            similarity_key = (tuple(top_talents), tuple(top_attrs))
+        for config in surviving_configs:
+            similarity_key = _similarity_key(config)
             
             if similarity_key in similarity_cache:
-                # Use cached result with small random variation
-                cached_result = similarity_cache[similarity_key].copy()
-                # Add small random noise to prevent exact duplicates
-                import random
-                noise = random.uniform(-0.05, 0.05)
-                cached_result['avg_stage'] *= (1 + noise)
-                cached_result['max_stage'] = max(cached_result['max_stage'], cached_result['avg_stage'])
-                cached_results.append((config_json, cached_result))
+                # Use cached result as-is; it is only scored, never mutated or returned,
+                # and ties are broken by config order when survivors are picked
+                cached_results.append((config, similarity_cache[similarity_key]))
                 cache_hits += 1
             else:
-                filtered_configs.append(config_json)
+                filtered_configs.append(config)
+                filtered_keys.append(similarity_key)
         
         surviving_configs = filtered_configs
         if cache_hits > 0:
@@ -314,19 +455,20 @@ def evaluate_builds_successive_halving(build_configs, base_sims=64, rounds=3, su
                 # But limit to prevent memory issues
                 import multiprocessing
                 cpu_count = multiprocessing.cpu_count()
-                optimal_batch_size = min(len(surviving_configs), max(100, cpu_count * 50))  # 50 builds per CPU core
+                optimal_batch_size = min(len(surviving_configs), max(batch_size, cpu_count * 50))  # at least 50 builds per CPU core
                 _log(f"[RUST] Using optimized batch size: {optimal_batch_size} for {cpu_count} CPU cores\n")
                 
-                # Process in optimal chunks
-                all_batch_results = []
-                for i in range(0, len(surviving_configs), optimal_batch_size):
-                    chunk_configs = surviving_configs[i:i + optimal_batch_size]
-                    parsed_configs = [json.loads(cfg) for cfg in chunk_configs]
-                    chunk_results = rust_sim.simulate_batch(parsed_configs, current_sims, True)
-                    all_batch_results.extend(chunk_results)
-                batch_results = all_batch_results
+                if len(surviving_configs) <= optimal_batch_size:
+                    # Everything fits in one call - no slicing or re-collecting of results
+                    batch_results = rust_sim.simulate_batch(surviving_configs, current_sims, True)
+                else:
+                    # Process in optimal chunks
+                    batch_results = []
+                    for i in range(0, len(surviving_configs), optimal_batch_size):
+                        chunk_configs = surviving_configs[i:i + optimal_batch_size]
+                        batch_results.extend(rust_sim.simulate_batch(chunk_configs, current_sims, True))
             else:
-                # Python backend: process all at once (slower but simpler)
+                # Python backend: process all at once, spread over the CPU cores
                 batch_results = python_simulate_batch(surviving_configs, current_sims)
             
             _log(f"[DEBUG] {backend_name} simulate_batch completed, got {len(batch_results)} results\n")
@@ -334,113 +476,51 @@ def evaluate_builds_successive_halving(build_configs, base_sims=64, rounds=3, su
             # Update total sims
             total_sims += len(surviving_configs) * current_sims
             
-            # Update progress
-            if progress_file and start_time is not None:
-                try:
-                    if os.path.exists(progress_file):
-                        with open(progress_file, 'r') as f:
-                            progress_data = json.load(f)
-                        progress_data['total_sims'] = total_sims
-                        progress_data['sims_per_sec'] = total_sims / (time.time() - start_time) if time.time() > start_time else 0
-                        temp_progress = progress_file + '.tmp'
-                        with open(temp_progress, 'w') as f:
-                            json.dump(progress_data, f)
-                        os.replace(temp_progress, progress_file)
-                        _log(f"[DEBUG] Updated total_sims to {total_sims}, sims_per_sec {progress_data['sims_per_sec']:.0f}\n")
-                except Exception as e:
-                    _log(f"[DEBUG] Progress update error: {e}\n")
+            # Update sim counters; they are flushed with the round-end progress write below
+            if progress_data is not None and start_time is not None:
+                progress_data['total_sims'] = total_sims
+                progress_data['sims_per_sec'] = total_sims / (time.time() - start_time) if time.time() > start_time else 0
+                _log(f"[DEBUG] Updated total_sims to {total_sims}, sims_per_sec {progress_data['sims_per_sec']:.0f}\n")
         
         # ALWAYS process results and combine with cached results (even if all cached)
-        config_scores = []
-        
-        # Process cached results
-        for config_json, result in cached_results:
-            if isinstance(result, str):
-                result = json.loads(result)
-            # Use composite score: 70% stage + 30% normalized loot
-            avg_stage = result.get('avg_stage', 0)
-            avg_loot = result.get('avg_loot_per_hour', 0)
-            
-            # Early termination: skip builds that are clearly suboptimal
-            # If we're in later rounds and this build is performing very poorly, don't waste time
-            if round_num >= 2:  # After first couple rounds
-                if 'best_score_so_far' in locals() and avg_stage < best_score_so_far * 0.3:  # Less than 30% of best
-                    continue  # Skip this build entirely
-            
-            # Normalize loot to 0-1 scale (assuming max loot around 1e6 for normalization)
-            normalized_loot = min(avg_loot / 1e6, 1.0)  # Cap at 1.0
-            
-            score = (avg_stage * 0.7) + (normalized_loot * 300 * 0.3)  # 300 stages max for scaling
-            config_scores.append((config_json, score))
-            
-            # Track best score for early termination
-            if 'best_score_so_far' not in locals() or score > best_score_so_far:
-                best_score_so_far = score
-        
-        # Process evaluated results
-        for config_json, result in zip(surviving_configs, batch_results):
-            if isinstance(result, str):
-                result = json.loads(result)
-            # Use composite score: 70% stage + 30% normalized loot
-            avg_stage = result.get('avg_stage', 0)
-            avg_loot = result.get('avg_loot_per_hour', 0)
-            
-            # Early termination: skip builds that are clearly suboptimal
-            # If we're in later rounds and this build is performing very poorly, don't waste time
-            if round_num >= 2:  # After first couple rounds
-                if 'best_score_so_far' in locals() and avg_stage < best_score_so_far * 0.3:  # Less than 30% of best
-                    continue  # Skip this build entirely
-            
-            # Normalize loot to 0-1 scale (assuming max loot around 1e6 for normalization)
-            normalized_loot = min(avg_loot / 1e6, 1.0)  # Cap at 1.0
-            
-            score = (avg_stage * 0.7) + (normalized_loot * 300 * 0.3)  # 300 stages max for scaling
-            config_scores.append((config_json, score))
-            
-            # Store result in similarity cache for future similar builds
-            config = json.loads(config_json)
-            talents = config.get('talents', {})
-            attrs = config.get('attributes', {})
-            top_talents = sorted(talents.items(), key=lambda x: x[1], reverse=True)[:3]
-            top_attrs = sorted(attrs.items(), key=lambda x: x[1], reverse=True)[:3]
-            similarity_key = (tuple(top_talents), tuple(top_attrs))
+        scored_cached, best_score_so_far = _score_results(cached_results, round_num, best_score_so_far)
+        scored_new, best_score_so_far = _score_results(zip(zip(surviving_configs, filtered_keys), batch_results), round_num, best_score_so_far)
+        
+        config_scores = [(config, score) for config, _, score in scored_cached]
+        for (config, similarity_key), result, score in scored_new:
+            config_scores.append((config, score))
+            # Store result in similarity cache for future similar builds - only the fields scoring reads
             if similarity_key not in similarity_cache:
-                similarity_cache[similarity_key] = result.copy()
-            
-            # Track best score for early termination
-            if 'best_score_so_far' not in locals() or score > best_score_so_far:
-                best_score_so_far = score
+                similarity_cache[similarity_key] = {
+                    'avg_stage': result.get('avg_stage', 0),
+                    'avg_loot_per_hour': result.get('avg_loot_per_hour', 0),
+                }
+        # Only (config, score) pairs move on to the next round - release this round's full result dicts
+        # now instead of holding them while the next, larger-sims round is simulated
+        del batch_results, cached_results, scored_cached, scored_new
         
-        # Sort by score (descending) and keep top fraction
-        config_scores.sort(key=lambda x: x[1], reverse=True)
+        # Keep the top fraction by score (descending)
         keep_count = max(1, int(len(config_scores) * survival_rate))
         _log(f"[HALVING DEBUG] config_scores={len(config_scores)}, survival_rate={survival_rate}, keep_count={keep_count}\n")
-        surviving_configs = [config for config, _ in config_scores[:keep_count]]
+        surviving_scored = heapq.nlargest(keep_count, config_scores, key=itemgetter(1))
+        surviving_configs = [config for config, _ in surviving_scored]
         _log(f"[HALVING DEBUG] After halving: surviving_configs={len(surviving_configs)}\n")
         
         # Log round results
-        best_score = config_scores[0][1] if config_scores else 0
+        best_score = surviving_scored[0][1] if surviving_scored else 0
         _log(f"🏆 Round {round_num+1} complete: {len(surviving_configs)} builds survive (top {survival_rate:.0%} of {len(config_scores)}) | Best: {best_score:.1f} stages\n")
         
         # Update progress file to show round progress WITH the halved count
         if progress_file:
             try:
                 _log(f"[DEBUG] Updating progress for round {round_num+1}, surviving: {len(surviving_configs)}, file: {progress_file}\n")
-                if os.path.exists(progress_file):
-                    # Read current progress
-                    with open(progress_file, 'r') as f:
-                        progress_data = json.load(f)
-                    
+                if progress_data is not None:
                     # Update with round info - use halved count in tier label for visibility
                     progress_data['tier'] = f"{tier_name} R{round_num+1}→{len(surviving_configs)}"
                     progress_data['builds_in_generation'] = len(surviving_configs)
                     progress_data['progress_percent'] = progress_data.get('progress_percent', 0)  # Keep current
                     
-                    # Write atomically
-                    temp_progress = progress_file + '.tmp'
-                    with open(temp_progress, 'w') as f:
-                        json.dump(progress_data, f)
-                    os.replace(temp_progress, progress_file)
+                    _write_progress(progress_file, progress_data)
                     
                     # Small delay to ensure GUI can see this
                     time.sleep(0.15)
@@ -451,8 +531,8 @@ def evaluate_builds_successive_halving(build_configs, base_sims=64, rounds=3, su
             except Exception as e:
                 _log(f"[DEBUG] Progress update error: {e}\n")
         
-        # Double sims for next round
-        current_sims *= 2
+        # Grow sims for next round
+        current_sims *= eta
         
         # Periodic memory cleanup
         if round_num % 3 == 0:  # Every 3 rounds
@@ -463,52 +543,35 @@ def evaluate_builds_successive_halving(build_configs, base_sims=64, rounds=3, su
     
     # Final evaluation with full sim count for survivors
     if surviving_configs:
-        final_sims = current_sims  # Use the doubled amount from last round
+        final_sims = current_sims  # Use the grown amount from last round
         _log(f"[SH Final] Evaluating {len(surviving_configs)} survivors with {final_sims} sims each\n")
         
         # Update progress for final round
-        if progress_file and os.path.exists(progress_file):
+        if progress_data is not None:
             try:
-                with open(progress_file, 'r') as f:
-                    progress_data = json.load(f)
                 progress_data['tier'] = f"{tier_name} Final"
                 progress_data['builds_in_generation'] = len(surviving_configs)
-                temp_progress = progress_file + '.tmp'
-                with open(temp_progress, 'w') as f:
-                    json.dump(progress_data, f)
-                os.replace(temp_progress, progress_file)
+                _write_progress(progress_file, progress_data)
             except Exception as e:
                 _log(f"[DEBUG] Final progress update error: {e}\n")
         
         if use_rust:
-            # Parse JSON strings to dicts for Rust
-            parsed_configs = [json.loads(cfg) for cfg in surviving_configs]
-            batch_results = rust_sim.simulate_batch(parsed_configs, final_sims, True)
+            batch_results = rust_sim.simulate_batch(surviving_configs, final_sims, True)
         else:
             batch_results = python_simulate_batch(surviving_configs, final_sims)
         
         # Update total sims for final round
         total_sims += len(surviving_configs) * final_sims
-        if progress_file and start_time is not None:
+        if progress_data is not None and start_time is not None:
             try:
-                if os.path.exists(progress_file):
-                    with open(progress_file, 'r') as f:
-                        progress_data = json.load(f)
-                    progress_data['total_sims'] = total_sims
-                    progress_data['sims_per_sec'] = total_sims / (time.time() - start_time) if time.time() > start_time else 0
-                    temp_progress = progress_file + '.tmp'
-                    with open(temp_progress, 'w') as f:
-                        json.dump(progress_data, f)
-                    os.replace(temp_progress, progress_file)
-                    _log(f"[DEBUG] Final update total_sims to {total_sims}, sims_per_sec {progress_data['sims_per_sec']:.0f}\n")
+                progress_data['total_sims'] = total_sims
+                progress_data['sims_per_sec'] = total_sims / (time.time() - start_time) if time.time() > start_time else 0
+                _write_progress(progress_file, progress_data)
+                _log(f"[DEBUG] Final update total_sims to {total_sims}, sims_per_sec {progress_data['sims_per_sec']:.0f}\n")
             except Exception as e:
                 _log(f"[DEBUG] Final progress update error: {e}\n")
         
-        final_results = []
-        for config_json, result in zip(surviving_configs, batch_results):
-            if isinstance(result, str):
-                result = json.loads(result)
-            final_results.append((config_json, result))
+        final_results = list(zip(surviving_configs, batch_results))
         _log(f"✅ Successive halving complete: {len(final_results)} builds fully evaluated\n")
         return final_results
     
@@ -594,47 +657,12 @@ def optimize_builds(hunter_name, level, base_config, irl_config, num_sims, build
     results = []
     tested = 0
     batch_configs = []
-    batch_metadata = []
     batch_size = max_batch_size  # Allow larger batches for massive scale optimization
+    sh_eta = 2  # successive halving sims growth per round, shared by the SH calls and their sims accounting
     total_sims = 0
     
-    # Track top 10 builds by different metrics (only keep these, not all results)
-    top_by_max_stage = []    # Min-heap of top 10 by max_stage
-    top_by_avg_stage = []    # Min-heap of top 10 by avg_stage
-    top_by_loot = []         # Min-heap of top 10 by avg_loot_per_hour
-    top_by_damage = []       # Min-heap of top 10 by avg_damage
-    top_by_xp = []           # Min-heap of top 10 by avg_xp
-    
-    def add_to_top_10(heap, build_result, metric_key):
-        """Generic function to add build to a top 10 heap by any metric"""
-        metric_value = build_result.get(metric_key, 0)
-        if len(heap) < 10:
-            heapq.heappush(heap, (metric_value, id(build_result), build_result))
-        elif metric_value > heap[0][0]:
-            heapq.heapreplace(heap, (metric_value, id(build_result), build_result))
-    
-    def update_top_lists(build_result):
-        """Update all top 10 lists - O(log 10) per metric"""
-        nonlocal top_by_max_stage, top_by_avg_stage, top_by_loot, top_by_damage, top_by_xp
-        add_to_top_10(top_by_max_stage, build_result, 'max_stage')
-        add_to_top_10(top_by_avg_stage, build_result, 'avg_stage')
-        add_to_top_10(top_by_loot, build_result, 'avg_loot_per_hour')
-        add_to_top_10(top_by_damage, build_result, 'avg_damage')
-        add_to_top_10(top_by_xp, build_result, 'avg_xp')
-    
-    def finalize_top_lists():
-        """Extract sorted top 10 from heaps for final output"""
-        nonlocal top_by_max_stage, top_by_avg_stage, top_by_loot, top_by_damage, top_by_xp
-        top_by_max_stage = sorted([item[2] for item in top_by_max_stage], 
-                                 key=lambda b: b['max_stage'], reverse=True)
-        top_by_avg_stage = sorted([item[2] for item in top_by_avg_stage],
-                                 key=lambda b: b['avg_stage'], reverse=True)
-        top_by_loot = sorted([item[2] for item in top_by_loot],
-                            key=lambda b: b.get('avg_loot_per_hour', 0), reverse=True)
-        top_by_damage = sorted([item[2] for item in top_by_damage],
-                              key=lambda b: b.get('avg_damage', 0), reverse=True)
-        top_by_xp = sorted([item[2] for item in top_by_xp],
-                          key=lambda b: b.get('avg_xp', 0), reverse=True)
+    # Collect final tier results, the top 10 lists by each metric are picked once at the end
+    final_tier_results = []
     
     # Progressive evolution: dynamic curriculum based on level
     if use_progressive:
@@ -660,7 +688,9 @@ def optimize_builds(hunter_name, level, base_config, irl_config, num_sims, build
     
     generation = 0
     generation_history = []
-    tested_builds = set()  # Track unique builds to avoid duplicates
+    # Track unique builds to avoid duplicates, keyed by (talent levels, attribute levels): every other section of a
+    # build config is shared, and the generator's combinations list every talent/attribute in its costs order
+    tested_builds = set()
     
     # Import baseline build generator
     try:
@@ -674,6 +704,15 @@ def optimize_builds(hunter_name, level, base_config, irl_config, num_sims, build
     
     elites = []  # For progressive optimization
     
+    # Sections shared by every build config, looked up once instead of per build
+    base_build_config = {
+        'mods': {},
+        'inscryptions': {},
+        'relics': base_config.get('relics', {}),
+        'gems': base_config.get('gems', {}),
+        'bonuses': base_config.get('bonuses', {})
+    }
+    
     for tier_idx, (point_multiplier, tier_name) in enumerate(tiers):
         is_final_tier = (tier_idx == len(tiers) - 1)
         talent_points = int(level * point_multiplier)
@@ -694,24 +733,14 @@ def optimize_builds(hunter_name, level, base_config, irl_config, num_sims, build
             baseline_build = create_balanced_baseline_build(hunter_name, level)
             
             # Create a single build configuration from the baseline
-            build_config = {
-                'talents': baseline_build['talents'],
-                'attributes': baseline_build['attributes'],
-                'mods': {},
-                'inscryptions': {},
-                'relics': base_config.get('relics', {}),
-                'gems': base_config.get('gems', {}),
-                'bonuses': base_config.get('bonuses', {})
-            }
+            build_config = {'talents': baseline_build['talents'], 'attributes': baseline_build['attributes'], **base_build_config}
             
-            # Create hash for duplicate detection (baseline builds are deterministic)
-            build_hash = hash(json.dumps(build_config, sort_keys=True))
-            tested_builds.add(build_hash)
+            # Record for duplicate detection (baseline builds are deterministic)
+            tested_builds.add((tuple(baseline_build['talents'].get(t, 0) for t in hunter_class.costs['talents']),
+                               tuple(baseline_build['attributes'].get(a, 0) for a in hunter_class.costs['attributes'])))
             
             # Add this single baseline build to the batch
-            config_json = json.dumps(build_config)
-            batch_configs.append(config_json)
-            batch_metadata.append((baseline_build['talents'], baseline_build['attributes']))
+            batch_configs.append(build_config)
             
             _log(f"[BASELINE] Added balanced baseline: talents={baseline_build['talents']}, attrs={baseline_build['attributes']}\n")
         else:
@@ -726,7 +755,6 @@ def optimize_builds(hunter_name, level, base_config, irl_config, num_sims, build
                 # Sample if too many combinations
                 total_combos = len(talent_combos) * len(attr_combos)
                 if total_combos > builds_per_gen:
-                    import random
                     sample_ratio = builds_per_gen / total_combos
                     talent_combos = random.sample(talent_combos, max(1, int(len(talent_combos) * sample_ratio)))
                     attr_combos = random.sample(attr_combos, max(1, int(len(attr_combos) * sample_ratio)))
@@ -734,46 +762,30 @@ def optimize_builds(hunter_name, level, base_config, irl_config, num_sims, build
                 _log(f"[TIER] First tier: {len(talent_combos)} talent combos x {len(attr_combos)} attr combos = {len(talent_combos)*len(attr_combos)} builds\n")
                 
                 for tal_combo in talent_combos:
+                    tal_key = tuple(tal_combo.values())
                     for attr_combo in attr_combos:
-                        build_config = {
-                            'talents': tal_combo,
-                            'attributes': attr_combo,
-                            'mods': {},
-                            'inscryptions': {},
-                            'relics': base_config.get('relics', {}),
-                            'gems': base_config.get('gems', {}),
-                            'bonuses': base_config.get('bonuses', {})
-                        }
-                        config_json = json.dumps(build_config)
-                        build_hash = hash(json.dumps(build_config, sort_keys=True))
-                        if build_hash in tested_builds:
+                        build_key = (tal_key, tuple(attr_combo.values()))
+                        if build_key in tested_builds:
                             duplicates_skipped += 1
                             continue
-                        tested_builds.add(build_hash)
-                        batch_configs.append(config_json)
-                        batch_metadata.append((tal_combo, attr_combo))
+                        tested_builds.add(build_key)
+                        batch_configs.append({'talents': tal_combo, 'attributes': attr_combo, **base_build_config})
             else:
                 # Subsequent tiers: extend elites + generate additional valid combinations
                 # Pass actual_level=level so unlock_level checks use real character level
                 generator = BuildGenerator(hunter_class, level, use_smart_sampling=True, talent_points=talent_points, attribute_points=attribute_points, actual_level=level)
                 # Extend elites
-                for elite_config in elites:
-                    elite = json.loads(elite_config)
+                for elite in elites:
                     extended_talents, extended_attrs = extend_elite_pattern(
                         elite['talents'], elite['attributes'], generator, talent_points, attribute_points
                     )
-                    build_config = {
-                        'talents': extended_talents,
-                        'attributes': extended_attrs,
-                        'mods': {},
-                        'inscryptions': {},
-                        'relics': base_config.get('relics', {}),
-                        'gems': base_config.get('gems', {}),
-                        'bonuses': base_config.get('bonuses', {})
-                    }
-                    config_json = json.dumps(build_config)
-                    batch_configs.append(config_json)
-                    batch_metadata.append((extended_talents, extended_attrs))
+                    # Elites extended from similar parents can land on the same build
+                    build_key = (tuple(extended_talents.values()), tuple(extended_attrs.values()))
+                    if build_key in tested_builds:
+                        duplicates_skipped += 1
+                        continue
+                    tested_builds.add(build_key)
+                    batch_configs.append({'talents': extended_talents, 'attributes': extended_attrs, **base_build_config})
                 
                 # Generate additional valid combinations
                 num_additional = builds_per_gen - len(elites)
@@ -784,7 +796,6 @@ def optimize_builds(hunter_name, level, base_config, irl_config, num_sims, build
                     # Sample if too many
                     total_combos = len(talent_combos) * len(attr_combos)
                     if total_combos > num_additional:
-                        import random
                         sample_ratio = num_additional / total_combos
                         talent_combos = random.sample(talent_combos, max(1, int(len(talent_combos) * sample_ratio)))
                         attr_combos = random.sample(attr_combos, max(1, int(len(attr_combos) * sample_ratio)))
@@ -792,48 +803,35 @@ def optimize_builds(hunter_name, level, base_config, irl_config, num_sims, build
                     _log(f"[TIER] Extended {len(elites)} elites, adding {len(talent_combos)*len(attr_combos)} valid builds\n")
                     
                     for tal_combo in talent_combos:
+                        tal_key = tuple(tal_combo.values())
                         for attr_combo in attr_combos:
-                            build_config = {
-                                'talents': tal_combo,
-                                'attributes': attr_combo,
-                                'mods': {},
-                                'inscryptions': {},
-                                'relics': base_config.get('relics', {}),
-                                'gems': base_config.get('gems', {}),
-                                'bonuses': base_config.get('bonuses', {})
-                            }
-                            config_json = json.dumps(build_config)
-                            build_hash = hash(json.dumps(build_config, sort_keys=True))
-                            if build_hash in tested_builds:
+                            build_key = (tal_key, tuple(attr_combo.values()))
+                            if build_key in tested_builds:
                                 duplicates_skipped += 1
                                 continue
-                            tested_builds.add(build_hash)
-                            batch_configs.append(config_json)
-                            batch_metadata.append((tal_combo, attr_combo))
+                            tested_builds.add(build_key)
+                            batch_configs.append({'talents': tal_combo, 'attributes': attr_combo, **base_build_config})
                 
                 # Process batch when full
                 if len(batch_configs) >= batch_size:
                     # Adaptive batch processing: reduce batch size if memory pressure detected
-                    import psutil
-                    try:
-                        memory_percent = psutil.virtual_memory().percent
-                        if memory_percent > 85:  # High memory usage
-                            effective_batch_size = max(100, batch_size // 4)  # Reduce batch size significantly
-                            _log(f"[MEMORY] High memory usage ({memory_percent:.1f}%), reducing batch size to {effective_batch_size}\n")
-                        elif memory_percent > 70:  # Moderate memory usage
-                            effective_batch_size = max(500, batch_size // 2)  # Reduce batch size moderately
-                            _log(f"[MEMORY] Moderate memory usage ({memory_percent:.1f}%), reducing batch size to {effective_batch_size}\n")
-                        else:
-                            effective_batch_size = batch_size
-                    except ImportError:
+                    memory_percent = _memory_percent()
+                    if memory_percent is None:
                         # psutil not available, use default
                         effective_batch_size = batch_size
                         _log(f"[MEMORY] psutil not available, using default batch size {effective_batch_size}\n")
+                    elif memory_percent > 85:  # High memory usage
+                        effective_batch_size = max(100, batch_size // 4)  # Reduce batch size significantly
+                        _log(f"[MEMORY] High memory usage ({memory_percent:.1f}%), reducing batch size to {effective_batch_size}\n")
+                    elif memory_percent > 70:  # Moderate memory usage
+                        effective_batch_size = max(500, batch_size // 2)  # Reduce batch size moderately
+                        _log(f"[MEMORY] Moderate memory usage ({memory_percent:.1f}%), reducing batch size to {effective_batch_size}\n")
+                    else:
+                        effective_batch_size = batch_size
                     
                     # Process in smaller chunks if batch is very large
                     for i in range(0, len(batch_configs), effective_batch_size):
                         chunk_configs = batch_configs[i:i + effective_batch_size]
-                        chunk_metadata = batch_metadata[i:i + effective_batch_size]
                         
                         _log(f"[BATCH] Processing chunk {i//effective_batch_size + 1}/{(len(batch_configs) + effective_batch_size - 1)//effective_batch_size} ({len(chunk_configs)} builds)\n")
                         
@@ -880,12 +878,12 @@ def optimize_builds(hunter_name, level, base_config, irl_config, num_sims, build
                             tier_name=tier_name,
                             total_sims=total_sims,
                             start_time=start_time,
-                            use_rust=use_rust
+                            use_rust=use_rust,
+                            eta=sh_eta
                         )
                         
                         # Process results and update tracking
-                        for config_json, result in sh_results:
-                            config = json.loads(config_json)
+                        for config, result in sh_results:
                             build_result = {
                                 'talents': config['talents'],
                                 'attributes': config['attributes'],
@@ -902,28 +900,18 @@ def optimize_builds(hunter_name, level, base_config, irl_config, num_sims, build
                             
                             gen_results.append(build_result)
                             if is_final_tier:
-                                update_top_lists(build_result)
+                                final_tier_results.append(build_result)
                             
                             if gen_best_max_so_far is None or build_result['max_stage'] > gen_best_max_so_far['max_stage']:
                                 gen_best_max_so_far = build_result
                             if gen_best_avg_so_far is None or build_result['avg_stage'] > gen_best_avg_so_far['avg_stage']:
                                 gen_best_avg_so_far = build_result
                         
-                        # Update sims counter for chunk
-                        total_sh_sims = 0
-                        surviving = len(chunk_configs)
-                        sims_per_build = base_sims
-                        for round_num in range(rounds + 1):
-                            total_sh_sims += surviving * sims_per_build
-                            surviving = max(1, int(surviving * survival_rate))
-                            sims_per_build *= 2
-                        
                         tested += len(chunk_configs)
-                        total_sims += total_sh_sims
+                        total_sims += _sh_total_sims(len(chunk_configs), base_sims, rounds, survival_rate, sh_eta)
                     
                     # Clear processed batches
                     batch_configs = []
-                    batch_metadata = []
         
         # Process final batch if any remaining
         if batch_configs:
@@ -955,12 +943,12 @@ def optimize_builds(hunter_name, level, base_config, irl_config, num_sims, build
                 tier_name=tier_name,
                 total_sims=total_sims,
                 start_time=start_time,
-                use_rust=use_rust
+                use_rust=use_rust,
+                eta=sh_eta
             )
             
             # Process results same as above
-            for config_json, result in sh_results:
-                config = json.loads(config_json)
+            for config, result in sh_results:
                 tal = config['talents']
                 att = config['attributes']
                 
@@ -980,48 +968,37 @@ def optimize_builds(hunter_name, level, base_config, irl_config, num_sims, build
                 
                 gen_results.append(build_result)
                 if is_final_tier:
-                    update_top_lists(build_result)
+                    final_tier_results.append(build_result)
                 
                 if gen_best_max_so_far is None or build_result['max_stage'] > gen_best_max_so_far['max_stage']:
                     gen_best_max_so_far = build_result
                 if gen_best_avg_so_far is None or build_result['avg_stage'] > gen_best_avg_so_far['avg_stage']:
                     gen_best_avg_so_far = build_result
             
-            # Calculate sims for final batch
-            total_sh_sims = 0
-            surviving = len(batch_configs)
-            sims_per_build = base_sims
-            for round_num in range(rounds + 1):
-                total_sh_sims += surviving * sims_per_build
-                surviving = max(1, int(surviving * survival_rate))
-                sims_per_build *= 2
-            
             tested += len(batch_configs)
-            total_sims += total_sh_sims
+            total_sims += _sh_total_sims(len(batch_configs), base_sims, rounds, survival_rate, sh_eta)
             batch_configs = []
-            batch_metadata = []
         
         # Write progress after final batch
         if gen_results:
-            gen_best_so_far = max(gen_results, key=lambda r: r['max_stage'])
+            gen_best_so_far = gen_best_max_so_far  # tracked incrementally while processing results
             progress_pct = ((generation - 1 + (len(gen_results) / builds_per_gen)) / len(tiers)) * 100
             elapsed_so_far = time.time() - start_time
             speed = total_sims / elapsed_so_far if elapsed_so_far > 0 else 0
             try:
-                with open(progress_file, 'w') as f:
-                    json.dump({
-                        'generation': generation,
-                        'total_generations': len(tiers),
-                        'progress': progress_pct,
-                        'builds_tested': tested,
-                        'builds_in_gen': len(gen_results),
-                        'builds_per_gen': builds_per_gen,
-                        'total_sims': total_sims,
-                        'elapsed': elapsed_so_far,
-                        'sims_per_sec': speed,
-                        'tier_name': tier_name,
-                        'best_stage': gen_best_so_far['max_stage']
-                    }, f)
+                _write_progress(progress_file, {
+                    'generation': generation,
+                    'total_generations': len(tiers),
+                    'progress': progress_pct,
+                    'builds_tested': tested,
+                    'builds_in_gen': len(gen_results),
+                    'builds_per_gen': builds_per_gen,
+                    'total_sims': total_sims,
+                    'elapsed': elapsed_so_far,
+                    'sims_per_sec': speed,
+                    'tier_name': tier_name,
+                    'best_stage': gen_best_so_far['max_stage']
+                })
             except Exception as progress_err:
                 pass  # Ignore progress write errors
         
@@ -1054,31 +1031,34 @@ def optimize_builds(hunter_name, level, base_config, irl_config, num_sims, build
             progress_pct = (generation / len(tiers)) * 100
             elapsed_so_far = time.time() - start_time
             speed = total_sims / elapsed_so_far if elapsed_so_far > 0 else 0
-            with open(progress_file, 'w') as f:
-                json.dump({
-                    'generation': generation,
-                    'generation_complete': True,  # Flag for GUI to update Generations tab
-                    'total_generations': len(tiers),
-                    'progress': progress_pct,
-                    'builds_tested': tested,
-                    'builds_in_gen': len(gen_results),
-                    'builds_per_gen': builds_per_gen,
-                    'duplicates_skipped': duplicates_skipped,
-                    'unique_builds_total': len(tested_builds),
-                    'total_sims': total_sims,
-                    'elapsed': elapsed_so_far,
-                    'sims_per_sec': speed,
-                    'tier_name': tier_name,
-                    'best_stage': gen_best_max['max_stage'],
-                    'best_avg_stage': gen_best_avg['avg_stage'],
-                    'best_talents': gen_best_max['talents'],
-                    'best_attributes': gen_best_max['attributes']
-                }, f)
+            _write_progress(progress_file, {
+                'generation': generation,
+                'generation_complete': True,  # Flag for GUI to update Generations tab
+                'total_generations': len(tiers),
+                'progress': progress_pct,
+                'builds_tested': tested,
+                'builds_in_gen': len(gen_results),
+                'builds_per_gen': builds_per_gen,
+                'duplicates_skipped': duplicates_skipped,
+                'unique_builds_total': len(tested_builds),
+                'total_sims': total_sims,
+                'elapsed': elapsed_so_far,
+                'sims_per_sec': speed,
+                'tier_name': tier_name,
+                'best_stage': gen_best_max['max_stage'],
+                'best_avg_stage': gen_best_avg['avg_stage'],
+                'best_talents': gen_best_max['talents'],
+                'best_attributes': gen_best_max['attributes']
+            })
     
     # All tiers complete - finalize results
     
-    # Finalize top 10 lists with a single batch sort (only now, not per-result)
-    finalize_top_lists()
+    # Pick the top 10 lists from the final tier results in one pass per metric (only now, not per-result)
+    top_by_max_stage = heapq.nlargest(10, final_tier_results, key=lambda b: b['max_stage'])
+    top_by_avg_stage = heapq.nlargest(10, final_tier_results, key=lambda b: b['avg_stage'])
+    top_by_loot = heapq.nlargest(10, final_tier_results, key=lambda b: b.get('avg_loot_per_hour', 0))
+    top_by_damage = heapq.nlargest(10, final_tier_results, key=lambda b: b.get('avg_damage', 0))
+    top_by_xp = heapq.nlargest(10, final_tier_results, key=lambda b: b.get('avg_xp', 0))
     
     elapsed = time.time() - start_time
     sims_per_sec = total_sims / elapsed if elapsed > 0 else 0
@@ -1290,59 +1270,12 @@ def run_optimization(config_file, result_file):
         results = []
         tested = 0
         batch_configs = []
-        batch_metadata = []
         batch_size = max_batch_size  # Allow larger batches for massive scale optimization
+        sh_eta = 2  # successive halving sims growth per round, shared by the SH calls and their sims accounting
         total_sims = 0
         
-        # Track top 10 builds by different metrics (only keep these, not all results)
-        top_by_max_stage = []    # Min-heap of top 10 by max_stage
-        top_by_avg_stage = []    # Min-heap of top 10 by avg_stage
-        top_by_loot = []         # Min-heap of top 10 by avg_loot_per_hour
-        top_by_damage = []       # Min-heap of top 10 by avg_damage
-        top_by_xp = []           # Min-heap of top 10 by avg_xp
-        top_by_composite = []    # Min-heap of top 10 by composite score
-        
-        def add_to_top_10(heap, build_result, metric_key):
-            """Generic function to add build to a top 10 heap by any metric"""
-            metric_value = build_result.get(metric_key, 0)
-            if len(heap) < 10:
-                heapq.heappush(heap, (metric_value, id(build_result), build_result))
-            elif metric_value > heap[0][0]:
-                heapq.heapreplace(heap, (metric_value, id(build_result), build_result))
-        
-        def add_to_top_10_by_fn(heap, build_result, score_fn):
-            """Add to top 10 heap using a custom score function"""
-            score = score_fn(build_result)
-            if len(heap) < 10:
-                heapq.heappush(heap, (score, id(build_result), build_result))
-            elif score > heap[0][0]:
-                heapq.heapreplace(heap, (score, id(build_result), build_result))
-        
-        def update_top_lists(build_result):
-            """Update all top 10 lists - O(log 10) per metric"""
-            nonlocal top_by_max_stage, top_by_avg_stage, top_by_loot, top_by_damage, top_by_xp, top_by_composite
-            add_to_top_10(top_by_max_stage, build_result, 'max_stage')
-            add_to_top_10(top_by_avg_stage, build_result, 'avg_stage')
-            add_to_top_10(top_by_loot, build_result, 'avg_loot_per_hour')
-            add_to_top_10(top_by_damage, build_result, 'avg_damage')
-            add_to_top_10(top_by_xp, build_result, 'avg_xp')
-            add_to_top_10_by_fn(top_by_composite, build_result, get_build_score)
-        
-        def finalize_top_lists():
-            """Extract sorted top 10 from heaps for final output"""
-            nonlocal top_by_max_stage, top_by_avg_stage, top_by_loot, top_by_damage, top_by_xp, top_by_composite
-            top_by_max_stage = sorted([item[2] for item in top_by_max_stage], 
-                                     key=lambda b: b['max_stage'], reverse=True)
-            top_by_avg_stage = sorted([item[2] for item in top_by_avg_stage],
-                                     key=lambda b: b['avg_stage'], reverse=True)
-            top_by_loot = sorted([item[2] for item in top_by_loot],
-                                key=lambda b: b.get('avg_loot_per_hour', 0), reverse=True)
-            top_by_damage = sorted([item[2] for item in top_by_damage],
-                                  key=lambda b: b.get('avg_damage', 0), reverse=True)
-            top_by_xp = sorted([item[2] for item in top_by_xp],
-                              key=lambda b: b.get('avg_xp', 0), reverse=True)
-            top_by_composite = sorted([item[2] for item in top_by_composite],
-                                     key=lambda b: get_build_score(b), reverse=True)
+        # Collect final tier results, the top 10 lists by each metric are picked once at the end
+        final_tier_results = []
         
         # Progressive evolution: dynamic curriculum based on level
         if use_progressive:
@@ -1386,14 +1319,25 @@ def run_optimization(config_file, result_file):
             'best_stage': 0,
             'run_id': time.time()  # Unique ID to detect stale data
         }
-        temp_progress = progress_file + '.tmp'
-        with open(temp_progress, 'w') as f:
-            json.dump(initial_progress, f)
-        os.replace(temp_progress, progress_file)
+        _write_progress(progress_file, initial_progress)
         
         # Small delay to ensure GUI sees the fresh progress file
         time.sleep(0.2)
         
+        # Everything but the talents/attributes is shared by all builds, so build the Rust config once and give
+        # each build a shallow copy (the batch keeps every config, so it can't be mutated in place)
+        base_rust_cfg = {
+            'hunter': hunter_name,
+            'level': level,
+            'stats': base_config.get('stats', {}),  # ALWAYS base stats - never mutated
+            'inscryptions': base_config.get('inscryptions', {}),
+            'mods': base_config.get('mods', {}),
+            'relics': base_config.get('relics', {}),
+            'gems': base_config.get('gems', {}),
+            'gadgets': base_config.get('gadgets', {}),
+            'bonuses': base_config.get('bonuses', {})
+        }
+        
         for tier_fraction, tier_name in tiers:
             generation += 1
             gen_start = time.time()
@@ -1423,10 +1367,12 @@ def run_optimization(config_file, result_file):
             gen_results = []
             duplicates_skipped = 0
             generation_requests = 0
-            last_progress_write = 0  # Track when we last wrote progress to avoid excessive file writes
+            last_progress_write = 0.0  # time.monotonic() of the last progress write during generation, to throttle file writes
             gen_best_max_so_far = None  # Track best build incrementally to avoid expensive max() later
             gen_best_avg_so_far = None
-            tested_builds = set()  # RESET per tier - allow same builds in different tiers
+            # RESET per tier - allow same builds in different tiers. Builds are keyed by their level tuples: the generator
+            # and extend_elite_pattern() both return every talent/attribute in the tier generator's costs order
+            tested_builds = set()
             
             # Determine how many builds to promote from previous generation
             if generation > 1 and results:
@@ -1463,7 +1409,7 @@ def run_optimization(config_file, result_file):
                 )
                 
                 # Apply small mutations AFTER extending (to explore nearby space)
-                import random
+                # Uses the global PRNG shared with BuildGenerator, so seeding `random` reproduces a whole run
                 if random.random() < 0.3:  # 30% chance to mutate
                     # Swap some points between talents
                     talent_keys = [t for t in talents if talents[t] > 0]
@@ -1479,10 +1425,7 @@ def run_optimization(config_file, result_file):
                                 talents[src] += 1  # Undo if can't add to dst
                 
                 # Create a hashable key for this build to check for duplicates
-                build_key = (
-                    tuple(sorted((k, v) for k, v in talents.items() if v > 0)),
-                    tuple(sorted((k, v) for k, v in attrs.items() if v > 0))
-                )
+                build_key = (tuple(talents.values()), tuple(attrs.values()))
                 
                 # Skip if we've already tested this build (even mutated versions)
                 if build_key in tested_builds:
@@ -1492,26 +1435,8 @@ def run_optimization(config_file, result_file):
                 
                 # Create config for promoted/mutated build
                 # STATS ARE ALWAYS LOCKED TO BASE CONFIG (never mutated)
-                cfg = copy.deepcopy(base_config)
-                cfg['talents'] = talents
-                cfg['attributes'] = attrs
-                
-                rust_cfg = {
-                    'hunter': hunter_name,
-                    'level': level,
-                    'stats': cfg.get('stats', {}),  # ALWAYS base stats - never mutated
-                    'talents': talents,
-                    'attributes': attrs,
-                    'inscryptions': cfg.get('inscryptions', {}),
-                    'mods': cfg.get('mods', {}),
-                    'relics': cfg.get('relics', {}),
-                    'gems': cfg.get('gems', {}),
-                    'gadgets': cfg.get('gadgets', {}),
-                    'bonuses': cfg.get('bonuses', {})
-                }
-                
-                batch_configs.append(json.dumps(rust_cfg))
-                batch_metadata.append((talents, attrs))
+                rust_cfg = {**base_rust_cfg, 'talents': talents, 'attributes': attrs}
+                batch_configs.append(rust_cfg)
                 
                 # For successive halving, collect all builds first, don't simulate in batches
                 # The simulation will happen at the end of the generation with successive halving
@@ -1523,15 +1448,9 @@ def run_optimization(config_file, result_file):
             stuck_attempts = 0  # Track consecutive failed generation attempts
             
             while builds_generated < num_generate and attempts < max_attempts:
-                attempts += 1
-                
-                if attempts % 100 == 0:
-                    print(f"Attempts {attempts}, builds_generated {builds_generated}, stuck {stuck_attempts}", flush=True)
-                
-                # Generate build
-                builds = generator.generate_smart_sample(sample_size=1)
-                if attempts % 100 == 0:
-                    print(f"Generate returned {len(builds)} builds", flush=True)
+                # Generate all builds still needed in one call, duplicates are topped up on the next pass.
+                # Never asks for more than can be used, so the random stream matches one-at-a-time generation
+                builds = generator.generate_smart_sample(sample_size=min(num_generate - builds_generated, max_attempts - attempts))
                 if not builds:
                     stuck_attempts += 1
                     if stuck_attempts >= 100:  # 100 consecutive None returns = generator is exhausted
@@ -1540,78 +1459,56 @@ def run_optimization(config_file, result_file):
                     continue
                 
                 stuck_attempts = 0  # Reset on successful generation
-                talents, attrs = builds[0]
-                
-                # Create a hashable key for this build (talents + attributes combo)
-                build_key = (
-                    tuple(sorted((k, v) for k, v in talents.items() if v > 0)),
-                    tuple(sorted((k, v) for k, v in attrs.items() if v > 0))
-                )
+                for talents, attrs in builds:
+                    attempts += 1
+                    
+                    if attempts % 100 == 0:
+                        print(f"Attempts {attempts}, builds_generated {builds_generated}, stuck {stuck_attempts}", flush=True)
+                    
+                    # Create a hashable key for this build (talents + attributes combo)
+                    build_key = (tuple(talents.values()), tuple(attrs.values()))
                 
-                # Skip if we've already tested this exact build
-                if build_key in tested_builds:
-                    duplicates_skipped += 1
-                    continue
+                    # Skip if we've already tested this exact build
+                    if build_key in tested_builds:
+                        duplicates_skipped += 1
+                        continue
                 
-                tested_builds.add(build_key)
-                builds_generated += 1  # Count successful generation
-                generation_requests += 1
+                    tested_builds.add(build_key)
+                    builds_generated += 1  # Count successful generation
+                    generation_requests += 1
                 
-                # Log progress every 100 builds
-                if builds_generated % 100 == 0:
-                    progress_pct = (builds_generated / num_generate) * 100
-                    _log(f"📊 Generated {builds_generated}/{num_generate} builds ({progress_pct:.0f}%) for {tier_name} tier\n")
+                    # Log progress every 100 builds
+                    if builds_generated % 100 == 0:
+                        progress_pct = (builds_generated / num_generate) * 100
+                        _log(f"📊 Generated {builds_generated}/{num_generate} builds ({progress_pct:.0f}%) for {tier_name} tier\n")
                     
-                    # Update progress bar
-                    if progress_file:
-                        try:
-                            overall_progress = ((generation - 1) / len(tiers)) * 100 + (builds_generated / num_generate) * (100 / len(tiers))
-                            if os.path.exists(progress_file):
-                                with open(progress_file, 'r') as f:
-                                    progress_data = json.load(f)
-                                progress_data['progress_percent'] = overall_progress
-                                progress_data['builds_in_generation'] = builds_generated
-                                temp_progress = progress_file + '.tmp'
-                                with open(temp_progress, 'w') as f:
-                                    json.dump(progress_data, f)
-                                os.replace(temp_progress, progress_file)
-                        except Exception as e:
-                            _log(f"[DEBUG] Progress update error: {e}\n")
+                        # Update progress bar
+                        if progress_file and time.monotonic() - last_progress_write >= PROGRESS_WRITE_INTERVAL:
+                            try:
+                                overall_progress = ((generation - 1) / len(tiers)) * 100 + (builds_generated / num_generate) * (100 / len(tiers))
+                                if os.path.exists(progress_file):
+                                    with open(progress_file, 'r') as f:
+                                        progress_data = json.load(f)
+                                    progress_data['progress_percent'] = overall_progress
+                                    progress_data['builds_in_generation'] = builds_generated
+                                    _write_progress(progress_file, progress_data)
+                                    last_progress_write = time.monotonic()
+                            except Exception as e:
+                                _log(f"[DEBUG] Progress update error: {e}\n")
                 
-                # DEBUG: Log first build of each tier
-                if builds_generated == 1:
-                    _log(f"[DEBUG] First build: talents_sum={sum(talents.values())}, attrs_sum={sum(attrs.values())}\n")
+                    # DEBUG: Log first build of each tier
+                    if builds_generated == 1:
+                        _log(f"[DEBUG] First build: talents_sum={sum(talents.values())}, attrs_sum={sum(attrs.values())}\n")
                     
                 
-                # Create config
-                cfg = copy.deepcopy(base_config)
-                cfg['talents'] = talents
-                cfg['attributes'] = attrs
+                    # Build Rust config
+                    rust_cfg = {**base_rust_cfg, 'talents': talents, 'attributes': attrs}
+                    batch_configs.append(rust_cfg)
                 
-                # Build Rust config JSON
-                rust_cfg = {
-                    'hunter': hunter_name,
-                    'level': level,
-                    'stats': cfg.get('stats', {}),
-                    'talents': talents,
-                    'attributes': attrs,
-                    'inscryptions': cfg.get('inscryptions', {}),
-                    'mods': cfg.get('mods', {}),
-                    'relics': cfg.get('relics', {}),
-                    'gems': cfg.get('gems', {}),
-                    'gadgets': cfg.get('gadgets', {}),
-                    'bonuses': cfg.get('bonuses', {})
-                }
-                
-                batch_configs.append(json.dumps(rust_cfg))
-                batch_metadata.append((talents, attrs))
-                
-                # Update progress every 100 builds during generation
-                if len(batch_configs) % 100 == 0 and len(batch_configs) > 0:
-                    try:
-                        temp_progress = progress_file + '.tmp'
-                        with open(temp_progress, 'w') as f:
-                            json.dump({
+                    # Update progress every 100 builds during generation (at most once per PROGRESS_WRITE_INTERVAL)
+                    if len(batch_configs) % 100 == 0 and time.monotonic() - last_progress_write >= PROGRESS_WRITE_INTERVAL:
+                        try:
+                            _write_progress(progress_file, {
                                 'generation': generation,
                                 'total_generations': len(tiers),
                                 'progress_percent': ((generation - 1) / len(tiers)) * 100,
@@ -1623,13 +1520,13 @@ def run_optimization(config_file, result_file):
                                 'sims_per_sec': 0,
                                 'tier': tier_name,
                                 'best_stage': 0
-                            }, f)
-                        os.replace(temp_progress, progress_file)
-                    except:
-                        pass
+                            })
+                            last_progress_write = time.monotonic()
+                        except:
+                            pass
                 
-                # For successive halving, collect all builds first, don't simulate in batches
-                # The simulation will happen at the end of the generation with successive halving
+                    # For successive halving, collect all builds first, don't simulate in batches
+                    # The simulation will happen at the end of the generation with successive halving
             
             
             # ===== GENERATION LOOP COMPLETE - USE SUCCESSIVE HALVING =====
@@ -1644,10 +1541,8 @@ def run_optimization(config_file, result_file):
                 
                 # Update progress to show simulation phase has started
                 _log(f"[DEBUG] Writing initial progress for successive halving: {len(batch_configs)} builds\n")
-                # Write to temp file first to avoid corruption
-                temp_progress = progress_file + '.tmp'
-                with open(temp_progress, 'w') as f:
-                    json.dump({
+                try:
+                    _write_progress(progress_file, {
                         'generation': generation,
                         'total_generations': len(tiers),
                         'progress_percent': generation / len(tiers) * 100,
@@ -1659,9 +1554,7 @@ def run_optimization(config_file, result_file):
                         'sims_per_sec': total_sims / (time.time() - start_time) if time.time() > start_time else 0,
                         'tier': tier_name,
                         'best_stage': max((r.get('max_stage', 0) for r in results), default=0)
-                    }, f)
-                try:
-                    os.replace(temp_progress, progress_file)
+                    })
                 except Exception as e:
                     _log(f"[DEBUG] Failed to update progress file: {e}\n")
                 
@@ -1706,14 +1599,14 @@ def run_optimization(config_file, result_file):
                     tier_name=tier_name,
                     total_sims=total_sims,
                     start_time=start_time,
-                    use_rust=use_rust
+                    use_rust=use_rust,
+                    batch_size=batch_size,
+                    eta=sh_eta
                 )
                 _log(f"[DEBUG] evaluate_builds_successive_halving returned {len(sh_results)} results\n")
                 
                 # Process successive halving results
-                for config_json, result in sh_results:
-                    # Parse metadata from config_json to get talents/attrs
-                    config = json.loads(config_json)
+                for config, result in sh_results:
                     tal = config['talents']
                     att = config['attributes']
                     
@@ -1734,48 +1627,37 @@ def run_optimization(config_file, result_file):
                     gen_results.append(build_result)
                     # Only track top 10 from final tier (100%) - earlier tiers have partial builds
                     if is_final_tier:
-                        update_top_lists(build_result)
+                        final_tier_results.append(build_result)
                     
                     if gen_best_max_so_far is None or build_result['max_stage'] > gen_best_max_so_far['max_stage']:
                         gen_best_max_so_far = build_result
                     if gen_best_avg_so_far is None or build_result['avg_stage'] > gen_best_avg_so_far['avg_stage']:
                         gen_best_avg_so_far = build_result
                 
-                # Calculate total sims used in successive halving (dynamic based on actual parameters)
-                total_sh_sims = 0
-                surviving = len(batch_configs)
-                sims_per_build = base_sims
-                for round_num in range(rounds + 1):  # rounds + final round
-                    total_sh_sims += surviving * sims_per_build
-                    surviving = max(1, int(surviving * survival_rate))
-                    sims_per_build *= 2
-                
                 tested += len(batch_configs)
-                total_sims += total_sh_sims
+                total_sims += _sh_total_sims(len(batch_configs), base_sims, rounds, survival_rate, sh_eta)
                 batch_configs = []
-                batch_metadata = []
             
             # Write progress after final batch
             if gen_results:
-                gen_best_so_far = max(gen_results, key=lambda r: r['max_stage'])
+                gen_best_so_far = gen_best_max_so_far  # tracked incrementally while processing results
                 progress_pct = ((generation - 1 + (len(gen_results) / builds_per_gen)) / len(tiers)) * 100
                 elapsed_so_far = time.time() - start_time
                 speed = total_sims / elapsed_so_far if elapsed_so_far > 0 else 0
                 try:
-                    with open(progress_file, 'w') as f:
-                        json.dump({
-                            'generation': generation,
-                            'total_generations': len(tiers),
-                            'progress': progress_pct,
-                            'builds_tested': tested,
-                            'builds_in_gen': len(gen_results),
-                            'builds_per_gen': builds_per_gen,
-                            'total_sims': total_sims,
-                            'elapsed': elapsed_so_far,
-                            'sims_per_sec': speed,
-                            'tier_name': tier_name,
-                            'best_stage': gen_best_so_far['max_stage']
-                        }, f)
+                    _write_progress(progress_file, {
+                        'generation': generation,
+                        'total_generations': len(tiers),
+                        'progress': progress_pct,
+                        'builds_tested': tested,
+                        'builds_in_gen': len(gen_results),
+                        'builds_per_gen': builds_per_gen,
+                        'total_sims': total_sims,
+                        'elapsed': elapsed_so_far,
+                        'sims_per_sec': speed,
+                        'tier_name': tier_name,
+                        'best_stage': gen_best_so_far['max_stage']
+                    })
                 except Exception as progress_err:
                     pass  # Ignore progress write errors
             
@@ -1809,31 +1691,35 @@ def run_optimization(config_file, result_file):
                 progress_pct = (generation / len(tiers)) * 100
                 elapsed_so_far = time.time() - start_time
                 speed = total_sims / elapsed_so_far if elapsed_so_far > 0 else 0
-                with open(progress_file, 'w') as f:
-                    json.dump({
-                        'generation': generation,
-                        'generation_complete': True,  # Flag for GUI to update Generations tab
-                        'total_generations': len(tiers),
-                        'progress': progress_pct,
-                        'builds_tested': tested,
-                        'builds_in_gen': len(gen_results),
-                        'builds_per_gen': builds_per_gen,
-                        'duplicates_skipped': duplicates_skipped,
-                        'unique_builds_total': len(tested_builds),
-                        'total_sims': total_sims,
-                        'elapsed': elapsed_so_far,
-                        'sims_per_sec': speed,
-                        'tier_name': tier_name,
-                        'best_stage': gen_best_max['max_stage'],
-                        'best_avg_stage': gen_best_avg['avg_stage'],
-                        'best_talents': gen_best_max['talents'],
-                        'best_attributes': gen_best_max['attributes']
-                    }, f)
+                _write_progress(progress_file, {
+                    'generation': generation,
+                    'generation_complete': True,  # Flag for GUI to update Generations tab
+                    'total_generations': len(tiers),
+                    'progress': progress_pct,
+                    'builds_tested': tested,
+                    'builds_in_gen': len(gen_results),
+                    'builds_per_gen': builds_per_gen,
+                    'duplicates_skipped': duplicates_skipped,
+                    'unique_builds_total': len(tested_builds),
+                    'total_sims': total_sims,
+                    'elapsed': elapsed_so_far,
+                    'sims_per_sec': speed,
+                    'tier_name': tier_name,
+                    'best_stage': gen_best_max['max_stage'],
+                    'best_avg_stage': gen_best_avg['avg_stage'],
+                    'best_talents': gen_best_max['talents'],
+                    'best_attributes': gen_best_max['attributes']
+                })
         
         # All tiers complete - finalize results
         
-        # Finalize top 10 lists with a single batch sort (only now, not per-result)
-        finalize_top_lists()
+        # Pick the top 10 lists from the final tier results in one pass per metric (only now, not per-result)
+        top_by_max_stage = heapq.nlargest(10, final_tier_results, key=lambda b: b['max_stage'])
+        top_by_avg_stage = heapq.nlargest(10, final_tier_results, key=lambda b: b['avg_stage'])
+        top_by_loot = heapq.nlargest(10, final_tier_results, key=lambda b: b.get('avg_loot_per_hour', 0))
+        top_by_damage = heapq.nlargest(10, final_tier_results, key=lambda b: b.get('avg_damage', 0))
+        top_by_xp = heapq.nlargest(10, final_tier_results, key=lambda b: b.get('avg_xp', 0))
+        top_by_composite = heapq.nlargest(10, final_tier_results, key=get_build_score)
         
         elapsed = time.time() - start_time
         sims_per_sec = total_sims / elapsed if elapsed > 0 else 0
@@ -1896,6 +1782,9 @@ def run_optimization(config_file, result_file):
                 'error': str(e),
                 'traceback': traceback.format_exc()
             }, f)
+    finally:
+        # Python backend workers live for the whole run; stop them once it is over
+        _shutdown_python_sim_pool()
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Hunter Simulator Optimization')
@@ -12,7 +12,8 @@ from string import capwords
 from typing import Dict, Generator, List, Tuple
 
 import rich
-from hunters import Borge, Hunter, Knox, Ozzy, hunter_name_spacing
+from hunters import (EVENT_ENEMY, EVENT_ENEMY_SPECIAL, EVENT_HUNTER, EVENT_HUNTER_SPECIAL, EVENT_REGEN, EVENT_STUN,
+                     Borge, Hunter, Knox, Ozzy)
 from tqdm import tqdm
 from units import Boss, Enemy
 
@@ -408,11 +409,11 @@ class Simulation():
         self.current_stage = 0
         self.elapsed_time = 0
         self.queue = []
-        hpush(self.queue, (round(hunter.speed, 3), 1, 'hunter'))
-        hpush(self.queue, (self.elapsed_time, 3, 'regen'))
+        hpush(self.queue, (round(hunter.speed, 3), 1, EVENT_HUNTER))
+        hpush(self.queue, (self.elapsed_time, 3, EVENT_REGEN))
         while not hunter.is_dead():
             logging.debug('')
-            logging.debug(f'Entering STAGE {self.current_stage}')
+            logging.debug('Entering STAGE %s', self.current_stage)
             self.spawn_enemies(hunter)
             while self.enemies:
                 logging.debug('')
@@ -422,31 +423,31 @@ class Simulation():
                 enemy.queue_initial_attack()
                 # combat loop
                 while not enemy.is_dead() and not hunter.is_dead():
-                    logging.debug(f'[  QUEUE]:           {self.queue}')
+                    logging.debug('[  QUEUE]:           %s', self.queue)
                     prev_time, _, action = hpop(self.queue)
-                    match action:
-                        case 'hunter':
-                            hunter.attack(enemy)
-                            hpush(self.queue, (round(prev_time + hunter.speed, 3), 1, 'hunter'))
-                        case 'enemy':
-                            enemy.attack(hunter)
-                            if not enemy.is_dead():
-                                hpush(self.queue, (round(prev_time + enemy.speed, 3), 2, 'enemy'))
-                        case 'stun':
-                            hunter.apply_stun(enemy, isinstance(enemy, Boss))
-                        case 'hunter_special':
-                            hunter.attack(enemy)
-                        case 'enemy_special':
-                            enemy.attack_special(hunter)
-                            if not enemy.is_dead():
-                                hpush(self.queue, (round(prev_time + enemy.speed2, 3), 2, 'enemy_special'))
-                        case 'regen':
-                            hunter.regen_hp()
-                            enemy.regen_hp()
-                            self.elapsed_time += 1
-                            hpush(self.queue, (self.elapsed_time, 3, 'regen'))
-                        case _:
-                            raise ValueError(f'Unknown action: {action}')
+                    # integer tags, checked roughly by frequency
+                    if action == EVENT_HUNTER:
+                        hunter.attack(enemy)
+                        hpush(self.queue, (round(prev_time + hunter.speed, 3), 1, EVENT_HUNTER))
+                    elif action == EVENT_ENEMY:
+                        enemy.attack(hunter)
+                        if not enemy.is_dead():
+                            hpush(self.queue, (round(prev_time + enemy.speed, 3), 2, EVENT_ENEMY))
+                    elif action == EVENT_REGEN:
+                        hunter.regen_hp()
+                        enemy.regen_hp()
+                        self.elapsed_time += 1
+                        hpush(self.queue, (self.elapsed_time, 3, EVENT_REGEN))
+                    elif action == EVENT_HUNTER_SPECIAL:
+                        hunter.attack(enemy)
+                    elif action == EVENT_ENEMY_SPECIAL:
+                        enemy.attack_special(hunter)
+                        if not enemy.is_dead():
+                            hpush(self.queue, (round(prev_time + enemy.speed2, 3), 2, EVENT_ENEMY_SPECIAL))
+                    elif action == EVENT_STUN:
+                        hunter.apply_stun(enemy, isinstance(enemy, Boss))
+                    else:
+                        raise ValueError(f'Unknown action: {action}')
                 if hunter.is_dead():
                     return
             self.complete_stage()
@@ -1,9 +1,9 @@
 import logging
-import random
 from heapq import heapify
 from heapq import heappush as hpush
+from random import random as rand  # bound once, combat rolls skip the module attribute lookup
 
-from hunters import Borge, Hunter, Ozzy, Knox
+from hunters import EVENT_ENEMY, EVENT_ENEMY_SPECIAL, Borge, Hunter, Knox, Ozzy
 
 unit_name_spacing: int = 7
 
@@ -209,6 +209,7 @@ class Enemy:
         self.special_damage: float = min(special_damage, 2.5)
         self.speed: float = speed
         self.has_special = False
+        self.max_enrage: bool = False  # only bosses reach max enrage, see Boss.attack()
         # Medusa anti-regen (applied dynamically during regen ticks with vectid multiplier)
         self.medusa_anti_regen: float = 0.0
         if isinstance(self, Boss): # regular boss enrage effect
@@ -240,9 +241,9 @@ class Enemy:
     def queue_initial_attack(self) -> None:
         """Queue the initial attacks of the enemy.
         """
-        hpush(self.sim.queue, (round(self.sim.elapsed_time + self.speed, 3), 2, 'enemy'))
+        hpush(self.sim.queue, (round(self.sim.elapsed_time + self.speed, 3), 2, EVENT_ENEMY))
         if self.has_special:
-            hpush(self.sim.queue, (round(self.sim.elapsed_time + self.speed2, 3), 2, 'enemy_special'))
+            hpush(self.sim.queue, (round(self.sim.elapsed_time + self.speed2, 3), 2, EVENT_ENEMY_SPECIAL))
 
     def attack(self, hunter: Hunter) -> None:
         """Attack the hunter.
@@ -250,14 +251,14 @@ class Enemy:
         Args:
             hunter (Hunter): The hunter to attack.
         """
-        if random.random() < self.special_chance:
+        if rand() < self.special_chance:
             damage = self.power * self.special_damage
             is_crit = True
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} (crit)")
+            logging.debug("[%*s][@%5s]:\tATTACK\t%6.2f (crit)", unit_name_spacing, self.name, self.sim.elapsed_time, damage)
         else:
             damage = self.power
             is_crit = False
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f}")
+            logging.debug("[%*s][@%5s]:\tATTACK\t%6.2f", unit_name_spacing, self.name, self.sim.elapsed_time, damage)
         hunter.receive_damage(self, damage, is_crit)
 
     def receive_damage(self, damage: float, is_reflected: bool = False) -> None:
@@ -266,12 +267,12 @@ class Enemy:
         Args:
             damage (float): Damage to receive.
         """
-        if not is_reflected and random.random() < self.evade_chance:
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE")
+        if not is_reflected and rand() < self.evade_chance:
+            logging.debug("[%*s][@%5s]:\tEVADE", unit_name_spacing, self.name, self.sim.elapsed_time)
         else:
             mitigated_damage = damage * (1 - self.damage_reduction)
             self.hp -= mitigated_damage
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
+            logging.debug("[%*s][@%5s]:\tTAKE\t%6.2f, %.2f HP left", unit_name_spacing, self.name, self.sim.elapsed_time, mitigated_damage, self.hp)
             if self.is_dead():
                 if is_reflected:
                     self.sim.hunter.helltouch_kills += 1
@@ -286,7 +287,7 @@ class Enemy:
         """
         effective_heal = min(value, self.missing_hp)
         self.hp += effective_heal
-        logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t{source.upper().replace('_', ' ')}\t{effective_heal:>6.2f}")
+        logging.debug("[%*s][@%5s]:\t%s\t%6.2f", unit_name_spacing, self.name, self.sim.elapsed_time, source.upper().replace('_', ' '), effective_heal)
 
     def regen_hp(self) -> None:
         """Regenerates hp according to the regen stat.
@@ -325,10 +326,10 @@ class Enemy:
         Args:
             duration (float): The duration of the stun.
         """
-        qe = [(p1, p2, u) for p1, p2, u in self.sim.queue if u == 'enemy'][0]
+        qe = [(p1, p2, u) for p1, p2, u in self.sim.queue if u == EVENT_ENEMY][0]
         self.sim.queue.remove(qe)
         hpush(self.sim.queue, (qe[0] + duration, qe[1], qe[2]))
-        logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tSTUNNED\t{duration:>6.2f} sec")
+        logging.debug("[%*s][@%5s]:\tSTUNNED\t%6.2f sec", unit_name_spacing, self.name, self.sim.elapsed_time, duration)
 
     def is_boss(self) -> bool:
         """Check if the unit is a boss.
@@ -346,23 +347,32 @@ class Enemy:
         """
         return self.hp <= 0
 
-    def on_death(self, suppress_logging: bool = False) -> None:
+    def on_death(self, suppress_logging: bool = False, clear_queue: bool = True) -> None:
         """Executes on death effects. For enemy units, that is mostly just removing them from the sim queue and incrementing hunter kills.
+
+        Args:
+            suppress_logging (bool, optional): Skip the death log line. Defaults to False.
+            clear_queue (bool, optional): Remove pending enemy actions from the sim queue. Defaults to True.
         """
         if not suppress_logging:
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDIED")
-        self.sim.queue = [(p1, p2, u) for p1, p2, u in self.sim.queue if u not in ['enemy', 'enemy_special']]
-        heapify(self.sim.queue)
+            logging.debug("[%*s][@%5s]:\tDIED", unit_name_spacing, self.name, self.sim.elapsed_time)
+        if clear_queue:
+            self.sim.queue = [(p1, p2, u) for p1, p2, u in self.sim.queue if u not in (EVENT_ENEMY, EVENT_ENEMY_SPECIAL)]
+            heapify(self.sim.queue)
         self.sim.hunter.total_kills += 1
         self.sim.hunter.on_kill(loot_type=self.loot_type)
 
-    def kill(self) -> None:
+    def kill(self, clear_queue: bool = True) -> None:
         """Kills the unit.
 
         Currently only used for Trample, which is a guaranteed kill.
+
+        Args:
+            clear_queue (bool, optional): Remove pending enemy actions from the sim queue. Only the enemy in combat has
+                queued actions, so units killed alongside it can skip the queue rebuild. Defaults to True.
         """
         self.hp = 0
-        self.on_death(suppress_logging=True)
+        self.on_death(suppress_logging=True, clear_queue=clear_queue)
 
     ### UTILITY
 
@@ -506,13 +516,13 @@ class Boss(Enemy):
         """
         super(Boss, self).attack(hunter)
         self.enrage_stacks += 1
-        logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tENRAGE\t{self.enrage_stacks:>6.2f} stacks")
+        logging.debug("[%*s][@%5s]:\tENRAGE\t%6.2f stacks", unit_name_spacing, self.name, self.sim.elapsed_time, self.enrage_stacks)
         # WASM: Max enrage triggers when stacks > 200 (not >= 200)
         if self.enrage_stacks > 200 and not self.max_enrage:
             self.max_enrage = True
             self.power = self.base_power * 3  # CIFI: 3x base power at max enrage
             self.special_chance = 1  # CIFI: 100% crit at max enrage
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tMAX ENRAGE (x3 base damage, 100% crit chance)")
+            logging.debug("[%*s][@%5s]:\tMAX ENRAGE (x3 base damage, 100%% crit chance)", unit_name_spacing, self.name, self.sim.elapsed_time)
 
     def attack_special(self, hunter: Hunter) -> None:
         """Attack the hunter with a special attack.
@@ -521,14 +531,14 @@ class Boss(Enemy):
             hunter (Hunter): The hunter to attack.
         """
         if self.secondary_attack == 'gothmorgor':
-            if random.random() < self.special_chance:
+            if rand() < self.special_chance:
                 damage = self.power * self.special_damage
                 is_crit = True
-                logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} SECONDARY (crit)")
+                logging.debug("[%*s][@%5s]:\tATTACK\t%6.2f SECONDARY (crit)", unit_name_spacing, self.name, self.sim.elapsed_time, damage)
             else:
                 damage = self.power
                 is_crit = False
-                logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} SECONDARY")
+                logging.debug("[%*s][@%5s]:\tATTACK\t%6.2f SECONDARY", unit_name_spacing, self.name, self.sim.elapsed_time, damage)
             hunter.receive_damage(self, damage, is_crit)
             self.enrage_stacks += 1
         elif self.secondary_attack == 'exoscarab':
@@ -568,7 +578,7 @@ class Boss(Enemy):
             # WASM: +5 enrage stacks added when harden ends
             self.enrage_stacks += 5
             self.damage_reduction = self.previous_dr
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tHARDEN ended, +5 enrage (now {self.enrage_stacks})")
+            logging.debug("[%*s][@%5s]:\tHARDEN ended, +5 enrage (now %s)", unit_name_spacing, self.name, self.sim.elapsed_time, self.enrage_stacks)
 
     def on_death(self) -> None:
         """Extends the Enemy::on_death() method to log enrage stacks on death.